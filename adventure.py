@@ -20,12 +20,14 @@ from __future__ import annotations
 import json
 from typing import Optional
 
-from game_entities import Location, Item, Player
+from game_entities import Location, Item, Player, Rule, SessionResult, UndoRecord, World, WorldDiff
 from event_logger import Event, EventList
+from results_store import ResultsStore
+from world_validator import validate_world
 
 # Note: You may add in other import statements here as needed
 
-MENU_COMMANDS = ["look", "inventory", "score", "log", "quit"]
+MENU_COMMANDS = ["look", "inventory", "score", "log", "undo", "redo", "quit"]
 WINNING_LOCATION = 0  # Dorm room where items must be deposited
 
 # Note: You may add helper functions, classes, etc. below as needed
@@ -41,32 +43,50 @@ class AdventureGame:
         - ongoing: Whether the game is still in progress.
         - player: The Player object tracking inventory, score, and moves.
         - max_moves: The maximum number of moves allowed before losing.
+        - moves_used: The number of moves the player has used.
         - winning_items: List of item names required to win the game.
 
     Representation Invariants:
         - self.current_location_id in self._locations
         - self.max_moves > 0
+        - self.player.moves_remaining == max(0, self.max_moves - self.moves_used)
     """
 
     # Private Instance Attributes (do NOT remove these two attributes):
     #   - _locations: a mapping from location id to Location object.
     #                       This represents all the locations in the game.
     #   - _items: a list of Item objects, representing all items in the game.
+    #   - _rules: a mapping from (item name, location id) to the puzzle Rule for using that item there.
+    #   - _undo_stack: the UndoRecords of the applied commands, most recent last.
+    #   - _redo_stack: the UndoRecords of the undone commands, most recently undone last.
+    #   - _record: the UndoRecord of the command currently being applied, if any.
+    #   - _scored_rules: the keys of the rules whose points have been awarded, so each rule only scores once per game.
 
     _locations: dict[int, Location]
     _items: list[Item]
+    _rules: dict[tuple[str, int], Rule]
+    _undo_stack: list[UndoRecord]
+    _redo_stack: list[UndoRecord]
+    _record: Optional[UndoRecord]
+    _scored_rules: set[tuple[str, int]]
     current_location_id: int  # Suggested attribute, can be removed
     ongoing: bool  # Suggested attribute, can be removed
     player: Player
     max_moves: int
+    moves_used: int
     winning_items: list[str]
 
-    def __init__(self, game_data_file: str, initial_location_id: int) -> None:
+    def __init__(self, game_data_file: str, initial_location_id: int, world: Optional[World] = None) -> None:
         """
         Initialize a new text adventure game, based on the data in the given file, setting starting location of game
         at the given initial location ID.
         (note: you are allowed to modify the format of the file as you see fit)
 
+        If world is given, it must be the World already loaded from game_data_file (e.g., cached from an earlier game);
+        the game starts from a fresh copy of it instead of reading the file again, and world itself is not changed.
+
+        The world is checked with validate_world when it is loaded; raise ValueError if any errors are found.
+
         Preconditions:
         - game_data_file is the filename of a valid game data JSON file
         """
@@ -78,16 +98,43 @@ class AdventureGame:
         # 1. Make sure the Location class is used to represent each location.
         # 2. Make sure the Item class is used to represent each item.
 
-        self._locations, self._items, self.max_moves, self.winning_items = self._load_game_data(game_data_file)
+        if world is None:
+            world = self.load_world(game_data_file)
+            self._locations, self._items, self._rules = world.locations, world.items, world.rules
+        else:
+            self._locations = {loc_id: Location(loc.id_num, loc.brief_description, loc.long_description,
+                                                loc.available_commands, loc.items.copy(), False, loc.locked)
+                               for loc_id, loc in world.locations.items()}
+            self._items = [Item(item.name, item.description, item.start_position, item.target_position,
+                                item.target_points) for item in world.items]
+            self._rules = dict(world.rules)
+
+        report = validate_world(world, initial_location_id, WINNING_LOCATION)
+        if not report.is_valid():
+            raise ValueError(f"Invalid game data in {game_data_file}: " + " ".join(report.errors))
+
+        self.max_moves, self.winning_items = world.max_moves, list(world.winning_items)
         self.current_location_id = initial_location_id
         self.ongoing = True
+        self.moves_used = 0
         self.player = Player(inventory=[], score=0, moves_remaining=self.max_moves)
+        self._undo_stack = []
+        self._redo_stack = []
+        self._record = None
+        self._scored_rules = set()
 
     @staticmethod
-    def _load_game_data(filename: str) -> tuple[dict[int, Location], list[Item], int, list[str]]:
+    def load_world(filename: str) -> World:
+        """Load and return the static World data from the JSON file with the given filename."""
+        return World(*AdventureGame._load_game_data(filename))
+
+    @staticmethod
+    def _load_game_data(filename: str) -> tuple[dict[int, Location], list[Item], dict[tuple[str, int], Rule],
+                                                int, list[str]]:
         """Load locations and items from a JSON file with the given filename and
         return a tuple consisting of (1) a dictionary of locations mapping each game location's ID to a Location object,
-        (2) a list of all Item objects, (3) max moves, and (4) winning items list."""
+        (2) a list of all Item objects, (3) a dictionary of puzzle rules keyed by (item name, location ID),
+        (4) max moves, and (5) winning items list."""
 
         with open(filename, 'r') as f:
             data = json.load(f)
@@ -116,10 +163,22 @@ class AdventureGame:
             )
             items.append(item_obj)
 
+        rules = {}
+        for rule_data in data.get('rules', []):
+            rule_obj = Rule(
+                rule_data['item'],
+                rule_data['location'],
+                rule_data.get('unlocks', -1),
+                rule_data.get('points', 0),
+                rule_data.get('consumes', False),
+                rule_data.get('message', '')
+            )
+            rules[(rule_obj.item, rule_obj.location)] = rule_obj
+
         max_moves = data.get('max_moves', 40)
         winning_items = data.get('winning_items', [])
 
-        return locations, items, max_moves, winning_items
+        return locations, items, rules, max_moves, winning_items
 
     def get_location(self, loc_id: Optional[int] = None) -> Location:
         """Return Location object associated with the provided location ID.
@@ -137,6 +196,14 @@ class AdventureGame:
                 return item
         return None
 
+    def get_rule(self, item_name: str, loc_id: Optional[int] = None) -> Optional[Rule]:
+        """Return the puzzle Rule for using the given item at the given location, or None if there is none.
+        If no location ID is provided, use the current location.
+        """
+        if loc_id is None:
+            loc_id = self.current_location_id
+        return self._rules.get((item_name, loc_id))
+
     def get_inventory_names(self) -> list[str]:
         """Return a list of names of items in the player's inventory."""
         return [item.name for item in self.player.inventory]
@@ -165,9 +232,15 @@ class AdventureGame:
         """Return True if the player has lost the game (no moves remaining)."""
         return self.player.moves_remaining <= 0
 
+    def get_result(self, world: str, log: EventList) -> SessionResult:
+        """Return the outcome of this game so far, played in the given world (game data file) with the given log."""
+        return SessionResult(world, self.player.score, self.moves_used,
+                             self.check_win_condition(), log.get_id_log())
+
     def decrement_moves(self) -> None:
-        """Decrement the player's remaining moves by 1."""
-        self.player.moves_remaining -= 1
+        """Spend one of the player's moves."""
+        self.moves_used += 1
+        self.player.moves_remaining = max(0, self.max_moves - self.moves_used)
 
     def handle_take_command(self, item_name: str) -> str:
         """Handle the take command, picking up an item from the current location.
@@ -183,8 +256,10 @@ class AdventureGame:
             return f"Unknown item: {item_name}"
 
         # Remove from location and add to inventory
-        location.items.remove(item_name)
+        index = location.items.index(item_name)
+        location.items.pop(index)
         self.player.inventory.append(item)
+        self._note_item_change('take', item, index)
         return f"You picked up the {item_name}."
 
     def handle_drop_command(self, item_name: str) -> str:
@@ -201,11 +276,15 @@ class AdventureGame:
         location = self.get_location()
 
         # Remove from inventory
-        self.player.inventory = [i for i in self.player.inventory if i.name != item_name]
+        index = inventory_names.index(item_name)
+        self.player.inventory.pop(index)
+        self._note_item_change('drop', item, index)
 
         # Check if this is the target location
         if location.id_num == item.target_position:
             self.player.score += item.target_points
+            if self._record is not None:
+                self._record.deposited = True
             return f"You deposited the {item_name}. +{item.target_points} points!"
         else:
             # Just drop at current location
@@ -213,30 +292,42 @@ class AdventureGame:
             return f"You dropped the {item_name}."
 
     def handle_use_command(self, item_name: str) -> str:
-        """Handle the use command for special items like keys.
+        """Handle the use command, applying the puzzle rule for the given item at the current location.
         Returns a message describing the result.
         """
-        if item_name not in self.get_inventory_names():
+        inventory_names = self.get_inventory_names()
+
+        if item_name not in inventory_names:
             return f"You don't have a {item_name} in your inventory."
 
-        if item_name == "key":
-            # Check if at a location adjacent to the locked T.A. office (location 8)
-            location = self.get_location()
-            if location.id_num == 5:  # Coffee shop, adjacent to office
-                office = self.get_location(8)
-                if office.locked:
-                    office.locked = False
-                    # Remove key from inventory
-                    self.player.inventory = [i for i in game.player.inventory if i.name != "key"]
-                    self.player.score += 40  # Bonus for solving puzzle
-                    return "You unlock the T.A. office door with the key. The door swings open! +10 points!"
-                else:
-                    return "The office door is already unlocked."
-            else:
-                return "There's nothing to unlock here."
-        else:
+        rule = self.get_rule(item_name)
+        if rule is None:
             return f"You can't use the {item_name} here."
 
+        if rule.unlocks != -1:
+            target = self.get_location(rule.unlocks)
+            if not target.locked:
+                return "That door is already unlocked."
+            target.locked = False
+            if self._record is not None:
+                self._record.unlocked_id = target.id_num
+
+        if rule.consumes:
+            # Remove the item from inventory
+            index = inventory_names.index(item_name)
+            self._note_item_change('use', self.player.inventory.pop(index), index)
+
+        message = rule.message or f"You used the {item_name}."
+        rule_key = (item_name, self.current_location_id)
+        if rule.points > 0 and rule_key not in self._scored_rules:
+            # Bonus for solving puzzle, only awarded the first time, so a reusable item can't farm points
+            self.player.score += rule.points
+            self._scored_rules.add(rule_key)
+            if self._record is not None:
+                self._record.scored_rule = rule_key
+            message += f" +{rule.points} points!"
+        return message
+
     def can_enter_location(self, loc_id: int) -> tuple[bool, str]:
         """Check if the player can enter the given location.
         Returns (True, '') if allowed, or (False, reason_message) if blocked.
@@ -246,6 +337,169 @@ class AdventureGame:
             return (False, "The door is locked! You need a key to enter.")
         return (True, "")
 
+    def apply_command(self, command: str, log: Optional[EventList] = None) -> str:
+        """Apply the given movement or item command, spending one move, and record how to undo it.
+        Applying a new command discards any commands that were undone and not redone.
+        Returns a message describing the result (empty for a successful move).
+
+        If log is given, it is kept in sync with the game: a new Event is added when the command moves the player,
+        and otherwise the command is recorded as the next_command of the log's last event.
+
+        Preconditions:
+            - command in self.get_location().available_commands or command.startswith(('take ', 'drop ', 'use '))
+        """
+        self._redo_stack.clear()
+        return self._apply_command(command, log)
+
+    def undo(self, log: Optional[EventList] = None) -> Optional[str]:
+        """Revert the game state to before the most recently applied command, and return that command.
+        Return None if there is no command to undo.
+
+        If log is given, it must be the log that was passed to apply_command; the command's event is removed from it.
+        """
+        if not self._undo_stack:
+            return None
+
+        record = self._undo_stack.pop()
+        inventory = self.player.inventory
+        if record.kind == 'take':
+            inventory.pop()
+            self.get_location(record.location_id).items.insert(record.index, record.item.name)
+        elif record.kind == 'drop':
+            if not record.deposited:
+                self.get_location(record.location_id).items.pop()
+            inventory.insert(record.index, record.item)
+        elif record.kind == 'use':
+            inventory.insert(record.index, record.item)
+        if record.unlocked_id is not None:
+            self.get_location(record.unlocked_id).locked = True
+        if record.scored_rule is not None:
+            self._scored_rules.discard(record.scored_rule)
+
+        self.current_location_id = record.location_id
+        self.player.score = record.score
+        self.moves_used = record.moves_used
+        self.player.moves_remaining = max(0, self.max_moves - self.moves_used)
+
+        if log is not None:
+            if record.moved:
+                log.remove_last_event()
+            else:
+                log.remove_last_command()
+
+        self._redo_stack.append(record)
+        return record.command
+
+    def redo(self, log: Optional[EventList] = None) -> Optional[str]:
+        """Re-apply the most recently undone command, and return that command.
+        Return None if there is no command to redo.
+        """
+        if not self._redo_stack:
+            return None
+
+        command = self._redo_stack.pop().command
+        self._apply_command(command, log)
+        return command
+
+    def apply_world_diff(self, diff: WorldDiff) -> None:
+        """Swap the static world data in the given diff into this game, in time proportional to the size of the diff.
+
+        The game's state is kept: the player's position, inventory, score and moves used, which doors are
+        unlocked, and the items at each existing location. The player's current location is never removed, and
+        neither is an item in the player's inventory.
+        """
+        for loc_id, new_loc in diff.locations.items():
+            location = self._locations.get(loc_id)
+            if location is None:
+                self._locations[loc_id] = Location(
+                    new_loc.id_num,
+                    new_loc.brief_description,
+                    new_loc.long_description,
+                    dict(new_loc.available_commands),
+                    new_loc.items.copy(),
+                    False,  # visited
+                    new_loc.locked
+                )
+            else:
+                location.brief_description = new_loc.brief_description
+                location.long_description = new_loc.long_description
+                location.available_commands = dict(new_loc.available_commands)
+        for loc_id in diff.removed_locations:
+            if loc_id != self.current_location_id:
+                self._locations.pop(loc_id, None)
+
+        if diff.items or diff.removed_items:
+            items_by_name = {item.name: item for item in self._items}
+            for name, new_item in diff.items.items():
+                item = items_by_name.get(name)
+                if item is None:
+                    self._items.append(Item(new_item.name, new_item.description, new_item.start_position,
+                                            new_item.target_position, new_item.target_points))
+                else:
+                    # Update in place, so that the same Item object stays in the player's inventory
+                    item.description = new_item.description
+                    item.start_position = new_item.start_position
+                    item.target_position = new_item.target_position
+                    item.target_points = new_item.target_points
+            removed = set(diff.removed_items) - set(self.get_inventory_names())
+            if removed:
+                self._items = [item for item in self._items if item.name not in removed]
+
+        self._rules.update(diff.rules)
+        for key in diff.removed_rules:
+            self._rules.pop(key, None)
+
+        # The moves already used still count against the new limit, so raising it gives the player more moves
+        self.max_moves = diff.max_moves
+        self.player.moves_remaining = max(0, self.max_moves - self.moves_used)
+        self.winning_items = list(diff.winning_items)
+
+    def _apply_command(self, command: str, log: Optional[EventList]) -> str:
+        """Apply the given command as in apply_command, without discarding the redo stack."""
+        location = self.get_location()
+        record = UndoRecord(command, location.id_num, self.player.score, self.moves_used)
+        self._record = record
+        result = ""
+        if command in location.available_commands:
+            target_loc_id = location.available_commands[command]
+            can_enter, result = self.can_enter_location(target_loc_id)
+            if can_enter:
+                self.current_location_id = target_loc_id
+        elif command.startswith("take "):
+            result = self.handle_take_command(command[5:].strip())
+        elif command.startswith("drop "):
+            result = self.handle_drop_command(command[5:].strip())
+        elif command.startswith("use "):
+            result = self.handle_use_command(command[4:].strip())
+        self._record = None
+        self.decrement_moves()
+
+        record.moved = self.current_location_id != record.location_id
+        if log is not None:
+            if record.moved:
+                new_location = self.get_location()
+                log.add_event(Event(new_location.id_num, new_location.long_description), command)
+            elif log.last is not None:
+                log.set_last_command(command)
+
+        self._undo_stack.append(record)
+        return result
+
+    def _note_item_change(self, kind: str, item: Item, index: int) -> None:
+        """Record on the command currently being applied (if any) that it moved the given item,
+        which was removed from the given index of its previous container.
+        """
+        if self._record is not None:
+            self._record.kind = kind
+            self._record.item = item
+            self._record.index = index
+
+
+def is_valid_choice(choice: str, location: Location) -> bool:
+    """Return whether the given choice is a valid command for the player to enter at the given location."""
+    return (choice in MENU_COMMANDS or choice in location.available_commands
+            or choice.startswith("take ") or choice.startswith("drop ") or choice.startswith("use "))
+
 
 if __name__ == "__main__":
     # When you are ready to check your work with python_ta, uncomment the following lines.
@@ -256,133 +510,120 @@ if __name__ == "__main__":
         'max-line-length': 120,
         'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
     })
+    from world_reload import WorldWatcher  # Imported here, since world_reload imports this module
 
     game_log = EventList()  # This is REQUIRED as one of the baseline requirements
     game = AdventureGame('game_data.json', 0)  # load data, setting initial location ID to 1
-    menu = ["look", "inventory", "score", "log", "quit"]  # Regular menu options available at each location
+    # Reload changes to the game data file into the game while it is being played. The watcher's lock is held
+    # whenever the game is used, so that a reload is never applied partway through a command.
+    watcher = WorldWatcher('game_data.json', initial_location_id=0)
+    watcher.register(game)
+    watcher.start()
+    menu = MENU_COMMANDS  # Regular menu options available at each location
     choice = None
 
+    # Add the first Event to the game log; game.apply_command adds an Event for each later change of location
+    start_loc = game.get_location()
+    game_log.add_event(Event(start_loc.id_num, start_loc.long_description), choice)
+
     # Note: You may modify the code below as needed; the following starter code is just a suggestion
     while game.ongoing:
         # Note: If the loop body is getting too long, you should split the body up into helper functions
         # for better organization. Part of your mark will be based on how well-organized your code is.
 
-        curr_loc = game.get_location()
-
-        # Add new Event to game log to represent current game location
-        #  Note that the <choice> variable should be the command which led to this event
-        event = Event(curr_loc.id_num, curr_loc.long_description)
-        game_log.add_event(event, choice)
-
-        # Depending on whether, or not it's been visited before,
-        #  print either full description (first time visit) or brief description (every subsequent visit) of location
-        print()
-        curr_loc.print_location_description()
-
-        # Win condition
-        if game.check_win_condition():
-            print("You win!")
-            print("You found all your items and made it back to your dorm!")
-            print("With your USB drive, charger, and lucky mug, you submit your project on time.")
-            print(f"Final Score: {game.player.score}")
-            game.ongoing = False
-            break
-
-        # Display possible actions at this location
-        print(f"\n[Moves remaining: {game.player.moves_remaining}] [Score: {game.player.score}]")
-        print("What to do? Choose from: look, inventory, score, log, quit")
-        print("At this location, you can also:")
-        for action in curr_loc.available_commands:
-            print("-", action)
-
-        # Show item-related commands
-        if curr_loc.items:
-            print("  - take [item name]")
-        if game.player.inventory:
-            print("  - drop [item name]")
-            if "key" in game.get_inventory_names():
-                print("  - use key")
-
-        # Get and validate choice
+        with watcher.lock:
+            curr_loc = game.get_location()
+
+            # Depending on whether, or not it's been visited before,
+            #  print either full description (first time visit) or brief description (every subsequent visit)
+            #  of location
+            print()
+            curr_loc.print_location_description()
+
+            # Win condition
+            if game.check_win_condition():
+                print("You win!")
+                print("You found all your items and made it back to your dorm!")
+                print("With your USB drive, charger, and lucky mug, you submit your project on time.")
+                print(f"Final Score: {game.player.score}")
+                game.ongoing = False
+                break
+
+            # Display possible actions at this location
+            print(f"\n[Moves remaining: {game.player.moves_remaining}] [Score: {game.player.score}]")
+            print("What to do? Choose from: " + ", ".join(menu))
+            print("At this location, you can also:")
+            for action in curr_loc.available_commands:
+                print("-", action)
+
+            # Show item-related commands
+            if curr_loc.items:
+                print("  - take [item name]")
+            if game.player.inventory:
+                print("  - drop [item name]")
+                for inv_item in game.player.inventory:
+                    if game.get_rule(inv_item.name) is not None:
+                        print(f"  - use {inv_item.name}")
+
+        # Get and validate choice (without holding the lock, so reloads can happen while waiting for input)
         choice = input("\nEnter action: ").lower().strip()
 
-        # Simplify by tweaking the loop on line 326
         # Parse and validate command
-        valid_command = False
-        if choice in menu:
-            valid_command = True
-        elif choice in curr_loc.available_commands:
-            valid_command = True
-        elif choice.startswith("take ") or choice.startswith("drop ") or choice.startswith("use "):
-            valid_command = True
-
-        while not valid_command:
+        with watcher.lock:
+            choice_is_valid = is_valid_choice(choice, game.get_location())
+        while not choice_is_valid:
             print("That was an invalid option; try again.")
             choice = input("\nEnter action: ").lower().strip()
-            if choice in menu:
-                valid_command = True
-            elif choice in curr_loc.available_commands:
-                valid_command = True
-            elif choice.startswith("take ") or choice.startswith("drop ") or choice.startswith("use "):
-                valid_command = True
-
-        print("========")
-        print("You decided to:", choice)
-
-        # Handle menu commands
-        if choice == "log":
-            print("\n--- Game Log ---")
-            game_log.display_events()
-        elif choice == "look":
-            curr_loc.print_location_description(full=True)
-        elif choice == "inventory":
-            if not game.player.inventory:
-                print("Your inventory is empty.")
-            else:
-                print("You are carrying:")
-                for inv_item in game.player.inventory:
-                    print(f" - {inv_item.name}: {inv_item.description}")
-        elif choice == "score":
-            print(f"Your current score is: {game.player.score}")
-        elif choice == "quit":
-            print("Bye")
-            game.ongoing = False
-
-        # Handle movement commands
-        elif choice in curr_loc.available_commands:
-            target_loc_id = curr_loc.available_commands[choice]
-            can_enter, block_msg = game.can_enter_location(target_loc_id)
-            if can_enter:
-                game.current_location_id = target_loc_id
-                game.decrement_moves()
+            with watcher.lock:
+                choice_is_valid = is_valid_choice(choice, game.get_location())
+
+        with watcher.lock:
+            print("========")
+            print("You decided to:", choice)
+
+            # Handle menu commands
+            if choice == "log":
+                print("\n--- Game Log ---")
+                game_log.display_events()
+            elif choice == "look":
+                game.get_location().print_location_description(full=True)
+            elif choice == "inventory":
+                if not game.player.inventory:
+                    print("Your inventory is empty.")
+                else:
+                    print("You are carrying:")
+                    for inv_item in game.player.inventory:
+                        print(f" - {inv_item.name}: {inv_item.description}")
+            elif choice == "score":
+                print(f"Your current score is: {game.player.score}")
+            elif choice == "undo":
+                undone = game.undo(game_log)
+                print(f"You undid: {undone}" if undone is not None else "There is nothing to undo.")
+            elif choice == "redo":
+                redone = game.redo(game_log)
+                print(f"You redid: {redone}" if redone is not None else "There is nothing to redo.")
+            elif choice == "quit":
+                print("Bye")
+                game.ongoing = False
+            elif not is_valid_choice(choice, game.get_location()):
+                print("The map changed while you were deciding; that option is no longer available.")
+
+            # Handle movement, take, drop and use commands (each one spends a move)
             else:
-                print(block_msg)
-                game.decrement_moves()
-
-        # Handle take command
-        elif choice.startswith("take "):
-            cmd_item_name = choice[5:].strip()
-            result = game.handle_take_command(cmd_item_name)
-            print(result)
-            game.decrement_moves()
-
-        # Handle drop command
-        elif choice.startswith("drop "):
-            cmd_item_name = choice[5:].strip()
-            result = game.handle_drop_command(cmd_item_name)
-            print(result)
-            game.decrement_moves()
-
-        # Handle use command
-        elif choice.startswith("use "):
-            cmd_item_name = choice[4:].strip()
-            result = game.handle_use_command(cmd_item_name)
-            print(result)
-            game.decrement_moves()
-
-        # Check lose condition
-        if game.check_lose_condition() and game.ongoing:
-            print("GAME OVER")
-            print("You ran out of moves.")
-            print(f"Final Score: {game.player.score}")
-            game.ongoing = False
+                result = game.apply_command(choice, game_log)
+                if result:
+                    print(result)
+
+            # Check lose condition
+            if game.check_lose_condition() and game.ongoing:
+                print("GAME OVER")
+                print("You ran out of moves.")
+                print(f"Final Score: {game.player.score}")
+                game.ongoing = False
+
+    watcher.stop()
+
+    # Save the outcome of this session
+    results = ResultsStore()
+    results.add_result(game.get_result('game_data.json', game_log))
+    results.close()
@@ -0,0 +1,138 @@
+"""CSC111 Project 1: Text Adventure Game - Batch Runner
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains code for Project 1 that plays scripted sessions through the real
+game engine (with scoring, locked doors, and the win and lose conditions of adventure.py),
+without prompts or output, for fast regression testing.
+
+A script is a stream of commands, one per line, read from a file or standard input. Sessions are
+separated by a line containing only "---", and each one starts a new game. As in the interactive
+game, invalid commands are skipped, and commands after the game ends (by winning, losing or
+quitting) are ignored. One JSON result record is written per session, for example:
+
+    python batch_runner.py walkthroughs.txt --world game_data.json > results.jsonl
+
+With --results, each session's result is also saved to a ResultsStore database, in batches.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+from typing import Iterable, Iterator, Optional, TextIO
+
+from adventure import AdventureGame, is_valid_choice
+from event_logger import Event, EventList
+from game_entities import SessionResult
+from results_store import ResultsStore
+
+SESSION_SEPARATOR = "---"
+
+
+def play_session(game: AdventureGame, commands: Iterable[str]) -> dict:
+    """Play the given commands in the given new game, and return its compact result record.
+
+    The record has the session's outcome ('win', 'lose', 'quit', or 'unfinished' if the commands ran out first),
+    its final score, the number of moves used, and the IDs of the locations visited, in order.
+    """
+    game_log = EventList()
+    start_loc = game.get_location()
+    game_log.add_event(Event(start_loc.id_num, start_loc.long_description))
+    outcome = "win" if game.check_win_condition() else "unfinished"
+
+    for line in commands:
+        if outcome != "unfinished":
+            break
+        choice = line.lower().strip()
+        if not is_valid_choice(choice, game.get_location()):
+            continue
+
+        if choice == "undo":
+            game.undo(game_log)
+        elif choice == "redo":
+            game.redo(game_log)
+        elif choice == "quit":
+            outcome = "quit"
+        elif choice not in ("look", "inventory", "score", "log"):
+            game.apply_command(choice, game_log)
+
+        # The interactive game checks for a loss right after each command, and for a win before the next one
+        if outcome == "unfinished" and game.check_lose_condition():
+            outcome = "lose"
+        elif outcome == "unfinished" and game.check_win_condition():
+            outcome = "win"
+
+    return {"outcome": outcome, "score": game.player.score,
+            "moves_used": game.moves_used, "ids": game_log.get_id_log()}
+
+
+def split_sessions(lines: Iterable[str]) -> Iterator[list[str]]:
+    """Yield the commands of each session in the given script lines, in order."""
+    session = []
+    for line in lines:
+        if line.strip() == SESSION_SEPARATOR:
+            yield session
+            session = []
+        elif line.strip():
+            session.append(line)
+    if session:
+        yield session
+
+
+def run_script(script: TextIO, output: TextIO, game_data_file: str, initial_location_id: int,
+               store: Optional[ResultsStore] = None) -> int:
+    """Play every session in the given script in the given world, writing one JSON record per line to output.
+    Return the number of sessions played.
+
+    The world is loaded and validated once, and every session starts from a fresh copy of it. If store is given,
+    each session's result is also added to it (labelled with game_data_file as its world).
+    """
+    world = AdventureGame.load_world(game_data_file)
+    count = 0
+    for count, commands in enumerate(split_sessions(script), 1):
+        record = play_session(AdventureGame(game_data_file, initial_location_id, world), commands)
+        if store is not None:
+            store.add_result(SessionResult(game_data_file, record["score"], record["moves_used"],
+                                           record["outcome"] == "win", record["ids"]))
+        record["session"] = count
+        output.write(json.dumps(record, separators=(",", ":")) + "\n")
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play scripted game sessions without prompts.")
+    parser.add_argument("script", nargs="?", type=argparse.FileType("r"), default=sys.stdin,
+                        help="file of commands, one per line, with sessions separated by '---' (default: stdin)")
+    parser.add_argument("--world", default="game_data.json", help="game data file to play in")
+    parser.add_argument("--start", type=int, default=0, help="starting location ID")
+    parser.add_argument("--results", metavar="DB", help="also save each session's result to this results database")
+    args = parser.parse_args()
+    results = ResultsStore(args.results) if args.results is not None else None
+    try:
+        run_script(args.script, sys.stdout, args.world, args.start, results)
+    finally:
+        if results is not None:
+            results.close()
+
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # Note: this is kept out of the command-line path above, so that scripted runs don't need python_ta and
+    # their JSON output isn't mixed with its report.
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
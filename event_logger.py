@@ -49,15 +49,42 @@ class EventList:
     """
     A linked list of game events.
 
+    The list keeps indexes of its events up to date as events are added and removed, so that analytics
+    questions and lookups by turn can be answered without walking the list.
+
     Instance Attributes:
         - first: Event object representing the first game event
         - last: Event object representing the last game event
+        - length: The number of events in this list
+        - visit_counts: A mapping from location id to the number of events at that location
+        - command_counts: A mapping from command to the number of times it was issued at the events in this list
+        - first_visit: A mapping from location id to the turn (position in this list, starting at 0) of the first
+          event at that location
 
     Representation Invariants:
         - (self.first is None) == (self.last is None)
+        - self.length == sum(self.visit_counts.values())
+        - all(count > 0 for count in self.visit_counts.values())
+        - all(count > 0 for count in self.command_counts.values())
+        - self.visit_counts.keys() == self.first_visit.keys()
+        - self.length == len(self._by_turn) == len(self._commands_by_turn) == len(self._reached_by_command)
     """
     first: Optional[Event]
     last: Optional[Event]
+    length: int
+    visit_counts: dict[int, int]
+    command_counts: dict[str, int]
+    first_visit: dict[int, int]
+
+    # Private Instance Attributes:
+    #   - _by_turn: the events in this list, in order, so that the event at any turn can be found in O(1)
+    #   - _commands_by_turn: the commands issued at each event in this list, in the order they were issued
+    #     (an event's next_command is only the last of these)
+    _by_turn: list[Event]
+    #   - _reached_by_command: whether each event in this list was added with a command, which was then recorded
+    #     as the last command issued at the event before it
+    _commands_by_turn: list[list[str]]
+    _reached_by_command: list[bool]
 
     # Note: You may ADD parameters/attributes/methods to this class as you see fit.
     # But do not rename or remove any existing methods/attributes in this class
@@ -66,6 +93,13 @@ class EventList:
         """Initialize a new empty event list."""
         self.first = None
         self.last = None
+        self.length = 0
+        self.visit_counts = {}
+        self.command_counts = {}
+        self.first_visit = {}
+        self._by_turn = []
+        self._commands_by_turn = []
+        self._reached_by_command = []
 
     def display_events(self) -> None:
         """Display all events in chronological order."""
@@ -85,6 +119,7 @@ class EventList:
         event in the game.
         """
         # Hint: You should update the previous node's <next_command> as needed
+        reached_by_command = command is not None and not self.is_empty()
         if self.is_empty():
             event.prev = None
             event.next = None
@@ -92,41 +127,117 @@ class EventList:
             self.first = event
             self.last = event
         else:
-            self.last.next_command = command
+            self.set_last_command(command)
             self.last.next = event
             event.prev = self.last
             event.next = None
             event.next_command = None
             self.last = event
 
+        if event.id_num not in self.visit_counts:
+            self.visit_counts[event.id_num] = 0
+            self.first_visit[event.id_num] = self.length
+        self.visit_counts[event.id_num] += 1
+        self.length += 1
+        self._by_turn.append(event)
+        self._commands_by_turn.append([])
+        self._reached_by_command.append(reached_by_command)
+
+    def set_last_command(self, command: Optional[str]) -> None:
+        """
+        Record that the given command was issued at the last event in this list, and set it as that event's
+        next_command. Every command issued is counted in command_counts, including commands that are later replaced
+        as the event's next_command. A command of None only clears the event's next_command.
+
+        Preconditions:
+            - not self.is_empty()
+        """
+        if command is not None:
+            self._commands_by_turn[-1].append(command)
+            self.command_counts[command] = self.command_counts.get(command, 0) + 1
+        self.last.next_command = command
+
+    def remove_last_command(self) -> None:
+        """
+        Remove the command most recently issued at the last event in this list (for example, because it was undone),
+        and set that event's next_command back to the command issued before it (or None if there is none).
+        If the list is empty or no command was issued at the last event, do nothing.
+        """
+        if self.is_empty() or not self._commands_by_turn[-1]:
+            return
+
+        commands = self._commands_by_turn[-1]
+        self._uncount_command(commands.pop())
+        self.last.next_command = commands[-1] if commands else None
+
+    def _uncount_command(self, command: str) -> None:
+        """Remove one use of the given command from command_counts."""
+        self.command_counts[command] -= 1
+        if self.command_counts[command] == 0:
+            del self.command_counts[command]
+
     def remove_last_event(self) -> None:
         """
-        Remove the last event from this event list.
-        If the list is empty, do nothing.
+        Remove the last event from this event list, along with the commands issued at it and the command
+        that led to it (if it was added with one). If the list is empty, do nothing.
         """
         # Hint: The <next_command> and <next> attributes for the new last event should be updated as needed
         if self.is_empty():
             return
 
+        removed = self._by_turn.pop()
+        for command in self._commands_by_turn.pop():
+            self._uncount_command(command)
+        removed.next_command = None
+        self.length -= 1
+        self.visit_counts[removed.id_num] -= 1
+        if self.visit_counts[removed.id_num] == 0:
+            del self.visit_counts[removed.id_num]
+            del self.first_visit[removed.id_num]
+
         if self.first is self.last:
+            self._reached_by_command.pop()
             self.first = None
             self.last = None
             return
 
         new_last = self.last.prev
-        new_last.next = None
-        new_last.next_command = None
-        self.last.prev = None
         self.last = new_last
+        if self._reached_by_command.pop():
+            self.remove_last_command()
+        else:
+            commands = self._commands_by_turn[-1]
+            new_last.next_command = commands[-1] if commands else None
+        new_last.next = None
+        removed.prev = None
+
+    def get_event(self, turn: int) -> Event:
+        """Return the event at the given turn (position in this list, starting at 0).
+        Negative turns count back from the end, as for list indexes. Raise IndexError if there is no such event.
+        """
+        return self._by_turn[turn]
+
+    def get_command(self, turn: int) -> Optional[str]:
+        """Return the next_command of the event at the given turn: the last command issued there, which led to the
+        event at the next turn if there is one. This is None only if no command was issued at that event (so the last
+        event usually has one too, for example after a take or drop command). Use get_commands for every command
+        issued at the event. Raise IndexError if there is no such event.
+        """
+        return self._by_turn[turn].next_command
+
+    def get_commands(self, turn: int) -> list[str]:
+        """Return every command issued at the event at the given turn, in the order they were issued.
+        Negative turns count back from the end, as for list indexes. Raise IndexError if there is no such event.
+        """
+        return list(self._commands_by_turn[turn])
+
+    def get_events(self, start: int, stop: int) -> list[Event]:
+        """Return the events from turn start up to (but not including) turn stop, as for list slices."""
+        return self._by_turn[start:stop]
 
     def get_id_log(self) -> list[int]:
         """Return a list of all location IDs visited for each event in this list, in sequence."""
-        ids = []
-        curr = self.first
-        while curr is not None:
-            ids.append(curr.id_num)
-            curr = curr.next
-        return ids
+        return [event.id_num for event in self._by_turn]
 
 
 if __name__ == '__main__':
@@ -139,3 +250,14 @@ if __name__ == '__main__':
         'allowed-io': ['EventList.display_events'],
         'disable': ['R1705', 'static_type_checker']
     })
+
+    # Check that removing an event added without a command keeps the commands issued at the event before it
+    check_log = EventList()
+    check_log.add_event(Event(0, "start"))
+    check_log.set_last_command("take x")
+    check_log.add_event(Event(1, "next"))
+    check_log.remove_last_event()
+    assert check_log.get_commands(0) == ["take x"] and check_log.command_counts == {"take x": 1}
+    check_log.add_event(Event(1, "next"), "go east")
+    check_log.remove_last_event()
+    assert check_log.get_commands(0) == ["take x"] and check_log.get_command(0) == "take x"
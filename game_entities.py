@@ -18,7 +18,9 @@ please consult our Course Syllabus.
 
 This file is Copyright (c) 2026 CSC111 Teaching Team
 """
+from __future__ import annotations
 from dataclasses import dataclass, field
+from typing import Optional
 
 
 @dataclass
@@ -86,6 +88,32 @@ class Item:
     target_points: int = 0
 
 
+@dataclass
+class Rule:
+    """A puzzle rule describing what happens when an item is used at a location.
+
+    Instance Attributes:
+        - item: The name of the item that must be used.
+        - location: The location ID where the item must be used.
+        - unlocks: The location ID that using the item unlocks (-1 if N/A).
+        - points: The number of points awarded when the rule is applied.
+        - consumes: Whether the item is removed from the player's inventory when the rule is applied.
+        - message: The message shown when the rule is applied.
+
+    Representation Invariants:
+        - self.location >= 0
+        - self.unlocks >= -1
+        - self.points >= 0
+    """
+
+    item: str
+    location: int
+    unlocks: int = -1
+    points: int = 0
+    consumes: bool = False
+    message: str = ""
+
+
 @dataclass
 class Player:
     """The player in our text adventure game.
@@ -105,6 +133,140 @@ class Player:
     moves_remaining: int = 40
 
 
+@dataclass
+class UndoRecord:
+    """The inverse of one command applied to an adventure game, used to revert the game state in O(1).
+
+    Instance Attributes:
+        - command: The command that was applied.
+        - location_id: The ID of the player's location before the command.
+        - score: The player's score before the command.
+        - moves_used: The number of moves the player had used before the command.
+        - moved: Whether the command moved the player (and so added an event to the game log).
+        - kind: 'take', 'drop' or 'use' if the command changed an item's position, or '' otherwise.
+        - item: The Item that was taken, dropped or used up by the command, if any.
+        - index: The position the item was removed from (in the location's items for 'take',
+                 and in the player's inventory for 'drop' and 'use').
+        - deposited: Whether a dropped item was deposited at its target location instead of left on the ground.
+        - unlocked_id: The ID of the location unlocked by the command, if any.
+        - scored_rule: The (item name, location ID) key of the rule whose points the command awarded, if any.
+
+    Representation Invariants:
+        - self.kind in {'', 'take', 'drop', 'use'}
+        - (self.kind in {'take', 'drop'}) <= (self.item is not None and self.index >= 0)
+    """
+
+    command: str
+    location_id: int
+    score: int
+    moves_used: int
+    moved: bool = False
+    kind: str = ''
+    item: Optional[Item] = None
+    index: int = -1
+    deposited: bool = False
+    unlocked_id: Optional[int] = None
+    scored_rule: Optional[tuple[str, int]] = None
+
+
+@dataclass
+class SessionResult:
+    """The outcome of one finished game session.
+
+    Instance Attributes:
+        - world: The name of the game data file the session was played in.
+        - score: The player's final score.
+        - moves_used: The number of moves the player used.
+        - won: Whether the player won the game.
+        - id_log: The IDs of the locations visited during the session, in order.
+
+    Representation Invariants:
+        - self.score >= 0
+        - self.moves_used >= 0
+    """
+
+    world: str
+    score: int
+    moves_used: int
+    won: bool
+    id_log: list[int] = field(default_factory=list)
+
+
+@dataclass
+class ValidationReport:
+    """The result of checking a World for problems before a game starts.
+
+    Instance Attributes:
+        - errors: Problems that make the game crash or impossible to win.
+        - warnings: Problems that do not stop the game from being won, such as locations that can't be reached.
+        - reachable: The IDs of the locations that can be reached from the starting location.
+        - min_moves: A lower bound on the number of moves needed to win the game (-1 if it can't be won).
+    """
+
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    reachable: set[int] = field(default_factory=set)
+    min_moves: int = -1
+
+    def is_valid(self) -> bool:
+        """Return whether no errors were found."""
+        return not self.errors
+
+
+@dataclass
+class World:
+    """The static data of a text adventure game world, as loaded from a game data file.
+
+    Instance Attributes:
+        - locations: A mapping from location ID to Location object, in its starting state.
+        - items: A list of all Item objects in the world.
+        - rules: A mapping from (item name, location ID) to the puzzle Rule for using that item there.
+        - max_moves: The maximum number of moves allowed before losing.
+        - winning_items: List of item names required to win the game.
+        - validation: A cache of the ValidationReport of this world for each (starting location ID, winning location ID)
+          checked so far.
+
+    Representation Invariants:
+        - all(loc_id == self.locations[loc_id].id_num for loc_id in self.locations)
+        - self.max_moves > 0
+    """
+
+    locations: dict[int, Location]
+    items: list[Item]
+    rules: dict[tuple[str, int], Rule]
+    max_moves: int
+    winning_items: list[str]
+    validation: dict[tuple[int, int], ValidationReport] = field(default_factory=dict)
+
+
+@dataclass
+class WorldDiff:
+    """The changes between two versions of a World's static data.
+
+    Only the static parts of each location (its descriptions and available commands) are compared, since a
+    location's items and lock state belong to the state of each game in progress.
+
+    Instance Attributes:
+        - locations: The new or changed locations, mapping location ID to Location object in its starting state.
+        - removed_locations: The IDs of the locations that no longer exist.
+        - items: The new or changed items, mapping item name to Item object.
+        - removed_items: The names of the items that no longer exist.
+        - rules: The new or changed puzzle rules, keyed by (item name, location ID).
+        - removed_rules: The keys of the puzzle rules that no longer exist.
+        - max_moves: The new maximum number of moves.
+        - winning_items: The new list of winning item names.
+    """
+
+    locations: dict[int, Location] = field(default_factory=dict)
+    removed_locations: list[int] = field(default_factory=list)
+    items: dict[str, Item] = field(default_factory=dict)
+    removed_items: list[str] = field(default_factory=list)
+    rules: dict[tuple[str, int], Rule] = field(default_factory=dict)
+    removed_rules: list[tuple[str, int]] = field(default_factory=list)
+    max_moves: int = 40
+    winning_items: list[str] = field(default_factory=list)
+
+
 if __name__ == "__main__":
     # When you are ready to check your work with python_ta, uncomment the following lines.
     # (Delete the "#" and space before each line.)
@@ -0,0 +1,129 @@
+"""CSC111 Project 1: Text Adventure Game - Log Analytics
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains code for Project 1 that saves game logs as journal files, and
+aggregates many journal files in parallel into a visit heatmap and the frequencies of the
+transitions between locations.
+
+A journal file has one line per event of a game log, in order. Each line is a JSON object with
+the event's location id ("id") and every command issued there, in order ("commands"). The last of
+an event's commands is the one that led to the next event.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from multiprocessing import Pool
+from typing import Optional
+
+from event_logger import EventList
+
+
+@dataclass
+class LogIndex:
+    """Counts aggregated over one or more game logs.
+
+    Instance Attributes:
+        - sessions: The number of game logs counted.
+        - visits: A mapping from location id to the number of events at that location (the visit heatmap).
+        - commands: A mapping from command to the number of times it was used.
+        - transitions: A mapping from (location id, next location id) to the number of times the player moved
+                       from the first location directly to the second.
+    """
+
+    sessions: int = 0
+    visits: Counter = field(default_factory=Counter)
+    commands: Counter = field(default_factory=Counter)
+    transitions: Counter = field(default_factory=Counter)
+
+    def merge(self, other: LogIndex) -> None:
+        """Add the counts in other to this index."""
+        self.sessions += other.sessions
+        self.visits.update(other.visits)
+        self.commands.update(other.commands)
+        self.transitions.update(other.transitions)
+
+
+def write_journal(log: EventList, filename: str) -> None:
+    """Save the given game log as a journal file with the given filename."""
+    with open(filename, 'w') as f:
+        for turn in range(log.length):
+            f.write(json.dumps({"id": log.get_event(turn).id_num, "commands": log.get_commands(turn)}) + "\n")
+
+
+def index_journal(filename: str) -> LogIndex:
+    """Return the LogIndex of the journal file with the given filename, reading it one line at a time."""
+    index = LogIndex(sessions=1)
+    prev_id = None
+    with open(filename, 'r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            index.visits[event["id"]] += 1
+            index.commands.update(event["commands"])
+            if prev_id is not None:
+                index.transitions[(prev_id, event["id"])] += 1
+            prev_id = event["id"]
+    return index
+
+
+def aggregate_journals(filenames: list[str], processes: Optional[int] = None, chunksize: int = 16) -> LogIndex:
+    """Return the merged LogIndex of all the journal files with the given filenames.
+
+    The files are indexed in parallel by the given number of worker processes (by default, one per CPU), and each
+    file's index is merged into the total as soon as it arrives rather than collecting every index first.
+    """
+    total = LogIndex()
+    with Pool(processes) as pool:
+        for index in pool.imap_unordered(index_journal, filenames, chunksize):
+            total.merge(index)
+    return total
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    })
+
+    import os
+    import tempfile
+    from adventure import AdventureGame
+    from event_logger import Event
+
+    # Check that every command issued is journaled, not just the last one at each location
+    with open(os.path.join("walkthroughs", "win.json"), 'r') as walkthrough_file:
+        win_walkthrough = json.load(walkthrough_file)
+    game = AdventureGame(win_walkthrough["world"], win_walkthrough["initial_location_id"])
+    game_log = EventList()
+    game_log.add_event(Event(game.get_location().id_num, game.get_location().long_description))
+    game.apply_command("take usb drive", game_log)  # Not available here, so it is undone below
+    game.undo(game_log)
+    for win_command in win_walkthrough["commands"]:
+        game.apply_command(win_command, game_log)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        journal_file = os.path.join(temp_dir, "win.jsonl")
+        write_journal(game_log, journal_file)
+        win_index = index_journal(journal_file)
+    assert sum(win_index.commands.values()) == len(win_walkthrough["commands"]) == 22
+    assert win_index.commands == Counter(game_log.command_counts)
+    assert sorted(win_index.visits.elements()) == sorted(win_walkthrough["expected_log"])
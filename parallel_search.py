@@ -0,0 +1,482 @@
+"""CSC111 Project 1: Text Adventure Game - Parallel Solver
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains code for Project 1 that finds a shortest winning list of commands
+for a game world, by a breadth-first search over game states spread across worker processes.
+
+A game state is the player's location, the position of every item (at a location, in the
+inventory, or gone), and which doors are still locked; the number of moves remaining is the
+search depth. Every state belongs to one worker, chosen by its hash, and only that worker keeps
+it in its visited set. The search runs one depth at a time: each worker expands the states it
+owns, and sends each new state to its owner by writing it to a shared-memory buffer, so states
+are never pickled.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import multiprocessing
+import time
+from array import array
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Barrier
+from typing import Optional
+
+from adventure import AdventureGame, WINNING_LOCATION
+from game_entities import World
+from simulation import AdventureGameSimulation
+from world_validator import validate_world
+
+INVENTORY = -1  # The position of an item in the player's inventory
+GONE = -2  # The position of an item that was deposited (or was never placed at a location)
+LOCK_BITS = 62  # The number of lock bits packed into each word of an encoded state
+BUFFER_RECORDS = 4096  # The number of states each worker can send to each other worker in one exchange round
+BARRIER_TIMEOUT = 300.0  # The number of seconds a worker waits for the others at each step before giving up
+POLL_INTERVAL = 0.1  # The number of seconds between checks that the workers are still running
+
+
+class SearchModel:
+    """The rules of a game world, as transitions between encoded game states.
+
+    An encoded state is a tuple of ints: the player's location ID, then the position of each item (a location ID,
+    INVENTORY or GONE), then the lock bits of the locations that start locked, LOCK_BITS per int.
+
+    Instance Attributes:
+        - commands: Every command that can change a game state, indexed by the transitions.
+        - start: The encoded starting state.
+        - width: The number of ints in an encoded state.
+        - max_moves: The maximum number of moves allowed before losing.
+    """
+    # Private Instance Attributes:
+    #   - _world: the World whose rules this model follows.
+    #   - _item_names: the name of each item, by position in an encoded state.
+    #   - _lock_index: a mapping from the ID of each location that starts locked to its lock bit.
+    #   - _command_index: a mapping from command to its index in self.commands.
+    #   - _winning: the positions (in an encoded state) of the winning items.
+    commands: list[str]
+    start: tuple[int, ...]
+    width: int
+    max_moves: int
+    _world: World
+    _item_names: list[str]
+    _lock_index: dict[int, int]
+    _command_index: dict[str, int]
+    _winning: list[int]
+
+    def __init__(self, world: World, initial_location_id: int) -> None:
+        """Initialize the model of the given world, for a game starting at the given location.
+
+        Preconditions:
+            - each item name appears in the items of at most one location of world
+        """
+        self._world = world
+        self._item_names = [item.name for item in world.items]
+        item_positions = {name: GONE for name in self._item_names}
+        self._lock_index = {}
+        self.commands = []
+        self._command_index = {}
+        for loc_id, location in world.locations.items():
+            for name in location.items:
+                if name in item_positions:
+                    item_positions[name] = loc_id
+            if location.locked:
+                self._lock_index[loc_id] = len(self._lock_index)
+            for command in location.available_commands:
+                self._add_command(command)
+        for name in self._item_names:
+            for verb in ("take", "drop", "use"):
+                self._add_command(f"{verb} {name}")
+
+        self._winning = [i for i, name in enumerate(self._item_names) if name in world.winning_items]
+        lock_words = [0] * -(-len(self._lock_index) // LOCK_BITS)
+        for bit in self._lock_index.values():
+            lock_words[bit // LOCK_BITS] |= 1 << (bit % LOCK_BITS)
+        self.start = (initial_location_id, *(item_positions[name] for name in self._item_names), *lock_words)
+        self.width = len(self.start)
+        self.max_moves = world.max_moves
+
+    def is_won(self, state: tuple[int, ...]) -> bool:
+        """Return whether the given state wins the game (as in AdventureGame.check_win_condition)."""
+        return state[0] == WINNING_LOCATION and all(state[1 + i] == GONE for i in self._winning)
+
+    def successors(self, state: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+        """Return (command index, next state) for each command that changes the given state, following the rules of
+        AdventureGame.apply_command.
+        """
+        loc_id = state[0]
+        n = len(self._item_names)
+        positions = state[1:1 + n]
+        locks = state[1 + n:]
+        result = []
+
+        for command, target in self._world.locations[loc_id].available_commands.items():
+            if not self._is_locked(locks, target):
+                result.append((self._command_index[command], (target,) + state[1:]))
+
+        for i, position in enumerate(positions):
+            name = self._item_names[i]
+            if position == loc_id:
+                result.append((self._command_index["take " + name], self._moved(state, i, INVENTORY)))
+            elif position == INVENTORY:
+                deposited = self._world.items[i].target_position == loc_id
+                result.append((self._command_index["drop " + name],
+                               self._moved(state, i, GONE if deposited else loc_id)))
+                use = self._used(state, i, locks)
+                if use is not None:
+                    result.append((self._command_index["use " + name], use))
+        return result
+
+    def _used(self, state: tuple[int, ...], i: int, locks: tuple[int, ...]) -> Optional[tuple[int, ...]]:
+        """Return the state after using item i (which is in the inventory) in the given state,
+        or None if that doesn't change the state.
+        """
+        rule = self._world.rules.get((self._item_names[i], state[0]))
+        if rule is None:
+            return None
+        new_state = state
+        if rule.unlocks != -1:
+            if not self._is_locked(locks, rule.unlocks):
+                return None
+            bit = self._lock_index[rule.unlocks]
+            word = len(state) - len(locks) + bit // LOCK_BITS
+            new_state = new_state[:word] + (new_state[word] & ~(1 << (bit % LOCK_BITS)),) + new_state[word + 1:]
+        if rule.consumes:
+            new_state = self._moved(new_state, i, GONE)
+        return new_state if new_state != state else None
+
+    def _is_locked(self, locks: tuple[int, ...], loc_id: int) -> bool:
+        """Return whether the given location is locked, given the lock words of a state."""
+        bit = self._lock_index.get(loc_id)
+        return bit is not None and bool(locks[bit // LOCK_BITS] >> (bit % LOCK_BITS) & 1)
+
+    def _add_command(self, command: str) -> None:
+        """Add the given command to self.commands, if it isn't there already."""
+        if command not in self._command_index:
+            self._command_index[command] = len(self.commands)
+            self.commands.append(command)
+
+    @staticmethod
+    def _moved(state: tuple[int, ...], i: int, position: int) -> tuple[int, ...]:
+        """Return the given state with item i moved to the given position."""
+        return state[:1 + i] + (position,) + state[2 + i:]
+
+
+@dataclass
+class WorkerStats:
+    """Statistics about one worker of a parallel search.
+
+    Instance Attributes:
+        - states_expanded: The number of states the worker expanded.
+        - states_visited: The number of states in the worker's visited set at the end of the search.
+        - elapsed: The number of seconds the worker spent searching.
+        - max_rss_kb: The worker process's peak memory use, in kilobytes (0 where this can't be measured).
+    """
+
+    states_expanded: int
+    states_visited: int
+    elapsed: float
+    max_rss_kb: int
+
+    def states_per_second(self) -> float:
+        """Return the number of states this worker expanded per second."""
+        return self.states_expanded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class SearchReport:
+    """The result of a parallel search.
+
+    Instance Attributes:
+        - commands: A shortest list of commands that wins the game, or None if it can't be won.
+        - elapsed: The number of seconds the search took.
+        - workers: The statistics of each worker.
+    """
+
+    commands: Optional[list[str]]
+    elapsed: float
+    workers: list[WorkerStats] = field(default_factory=list)
+
+
+def owner(state: tuple[int, ...], processes: int) -> int:
+    """Return the index of the worker that owns the given state.
+    (Tuples of ints hash the same way in every process.)
+    """
+    return hash(state) % processes
+
+
+def solve(game_data_file: str, initial_location_id: int, processes: int = 4,
+          buffer_records: int = BUFFER_RECORDS) -> SearchReport:
+    """Return a report with a shortest winning list of commands for the game in the given file, found by a search
+    across the given number of worker processes.
+
+    Each pair of workers shares a buffer of buffer_records states per exchange round. Of all the shortest winning
+    command lists, the one found is the same no matter how many processes are used.
+
+    The world is checked with validate_world first; raise ValueError if any errors are found, or if processes or
+    buffer_records is less than 1. Raise RuntimeError if a worker process fails, in which case the others are stopped.
+    """
+    if processes < 1 or buffer_records < 1:
+        raise ValueError("The number of processes and buffer_records must both be at least 1.")
+    world = AdventureGame.load_world(game_data_file)
+    validation = validate_world(world, initial_location_id, WINNING_LOCATION)
+    if not validation.is_valid():
+        raise ValueError(f"Invalid game data in {game_data_file}: " + " ".join(validation.errors))
+    model = SearchModel(world, initial_location_id)
+    record_size = 2 * model.width + 1
+    buffers = SharedMemory(create=True, size=processes * processes * buffer_records * record_size * 8)
+    counts = multiprocessing.Array('q', processes * processes, lock=False)
+    flags = multiprocessing.Array('q', processes, lock=False)
+    barrier = multiprocessing.Barrier(processes, timeout=BARRIER_TIMEOUT)
+    connections = []
+    workers = []
+
+    start = time.perf_counter()
+    try:
+        for w in range(processes):
+            parent_end, child_end = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_search_worker,
+                args=(w, processes, game_data_file, initial_location_id, buffers.name, buffer_records,
+                      counts, flags, barrier, child_end),
+                daemon=True
+            )
+            process.start()
+            connections.append(parent_end)
+            workers.append(process)
+
+        goals = []
+        report = SearchReport(None, 0.0)
+        for conn, process in zip(connections, workers):
+            goal, stats = _receive(conn, process)
+            report.workers.append(stats)
+            if goal is not None:
+                goals.append(goal)
+
+        if goals:
+            # Follow the parent links back from the goal, asking each state's owner for its parent
+            path = []
+            state = min(goals)
+            while True:
+                state_owner = owner(state, processes)
+                connections[state_owner].send(state)
+                state, command_index = _receive(connections[state_owner], workers[state_owner])
+                if state is None:
+                    break
+                path.append(model.commands[command_index])
+            report.commands = path[::-1]
+        report.elapsed = time.perf_counter() - start
+
+        for conn in connections:
+            conn.send(None)
+        for process in workers:
+            process.join()
+        return report
+    finally:
+        for process in workers:
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        buffers.close()
+        buffers.unlink()
+
+
+def _receive(conn: Connection, process: multiprocessing.Process) -> tuple:
+    """Return the next message from the given worker process through conn, checking every POLL_INTERVAL seconds
+    that the worker is still running. Raise RuntimeError if it has stopped without sending one.
+    """
+    try:
+        while not conn.poll(POLL_INTERVAL):
+            if not process.is_alive():
+                raise EOFError
+        return conn.recv()
+    except EOFError:  # The worker stopped, closing its end of the connection
+        process.join()
+        raise RuntimeError(f"Search worker {process.name} stopped with exit code {process.exitcode}.") from None
+
+
+def _peak_memory_kb() -> int:
+    """Return this process's peak memory use in kilobytes, or 0 where that can't be measured (the resource module
+    is only available on Unix).
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def verify_solution(game_data_file: str, initial_location_id: int, commands: list[str]) -> bool:
+    """Return whether the given commands win the game in the given file, checked with AdventureGameSimulation
+    and with the real game rules (locked doors and the move limit) of AdventureGame.
+    """
+    sim = AdventureGameSimulation(game_data_file, initial_location_id, commands)
+    if not sim.check_win_condition():
+        return False
+
+    game = AdventureGame(game_data_file, initial_location_id)
+    for command in commands:
+        if game.check_win_condition() or game.check_lose_condition():
+            return False
+        game.apply_command(command)
+    return game.check_win_condition() and not game.check_lose_condition()
+
+
+def _search_worker(w: int, processes: int, game_data_file: str, initial_location_id: int, buffer_name: str,
+                   buffer_records: int, counts: multiprocessing.Array, flags: multiprocessing.Array,
+                   barrier: Barrier, conn: Connection) -> None:
+    """Run worker w of a parallel search: search the states it owns (see _search_owned_states), then report to the
+    main process and answer its parent queries.
+
+    If the search fails, the barrier is broken, so that the other workers fail right away instead of waiting for
+    this one; the main process notices that the workers have stopped.
+    """
+    buffers = SharedMemory(name=buffer_name)
+    words = buffers.buf.cast('q')
+    try:
+        goal, visited, stats = _search_owned_states(w, processes, game_data_file, initial_location_id, words,
+                                                    buffer_records, counts, flags, barrier)
+    except BaseException:
+        barrier.abort()
+        raise
+    finally:
+        words.release()
+        buffers.close()
+    conn.send((goal, stats))
+
+    query = conn.recv()
+    while query is not None:
+        parent, command_index, _ = visited[query]
+        conn.send((parent, command_index))
+        query = conn.recv()
+
+
+def _search_owned_states(w: int, processes: int, game_data_file: str, initial_location_id: int, words: memoryview,
+                         buffer_records: int, counts: multiprocessing.Array, flags: multiprocessing.Array,
+                         barrier: Barrier) -> tuple[Optional[tuple[int, ...]], dict, WorkerStats]:
+    """Search the states owned by worker w one depth at a time, exchanging new states with the other workers
+    through the shared buffers (viewed as 64-bit words by words). Return the smallest goal state found by this
+    worker (or None), the mapping from each state it visited to (parent state, command index, depth), and its
+    statistics.
+
+    counts[src * processes + dst] holds the number of records src wrote for dst in the current round, and flags is
+    used each step for one value per worker (found a goal / has more to send / size of next frontier).
+    """
+    start_time = time.perf_counter()
+    model = SearchModel(AdventureGame.load_world(game_data_file), initial_location_id)
+    width = model.width
+    record_size = 2 * width + 1
+
+    # visited maps each owned state to (parent state, command index, depth); the start state has no parent
+    visited = {}
+    frontier = []
+    if owner(model.start, processes) == w:
+        visited[model.start] = (None, -1, 0)
+        frontier.append(model.start)
+    goal = None
+    expanded = 0
+
+    # The game is lost as soon as no moves remain, so a win must take fewer than max_moves commands
+    for depth in range(model.max_moves):
+        goals = [state for state in frontier if model.is_won(state)]
+        goal = min(goals) if goals else None
+        flags[w] = goal is not None
+        barrier.wait()
+        found = any(flags)
+        barrier.wait()
+        if found or depth == model.max_moves - 1:
+            break
+
+        # Expand the frontier, grouping the new states by owner
+        outgoing = [[] for _ in range(processes)]
+        for state in frontier:
+            expanded += 1
+            for command_index, next_state in model.successors(state):
+                outgoing[owner(next_state, processes)].append((next_state, state, command_index))
+
+        # Exchange the new states in rounds of at most buffer_records per pair of workers
+        next_frontier = []
+        sent = [0] * processes
+        more = True
+        while more:
+            for dst in range(processes):
+                batch = outgoing[dst][sent[dst]:sent[dst] + buffer_records]
+                base = (w * processes + dst) * buffer_records * record_size
+                for k, (next_state, state, command_index) in enumerate(batch):
+                    offset = base + k * record_size
+                    words[offset:offset + width] = array('q', next_state)
+                    words[offset + width:offset + 2 * width] = array('q', state)
+                    words[offset + 2 * width] = command_index
+                counts[w * processes + dst] = len(batch)
+                sent[dst] += len(batch)
+            flags[w] = any(sent[dst] < len(outgoing[dst]) for dst in range(processes))
+            barrier.wait()
+
+            for src in range(processes):
+                base = (src * processes + w) * buffer_records * record_size
+                for k in range(counts[src * processes + w]):
+                    offset = base + k * record_size
+                    next_state = tuple(words[offset:offset + width])
+                    candidate = (tuple(words[offset + width:offset + 2 * width]), words[offset + 2 * width],
+                                 depth + 1)
+                    known = visited.get(next_state)
+                    if known is None:
+                        visited[next_state] = candidate
+                        next_frontier.append(next_state)
+                    elif known[2] == depth + 1 and candidate[:2] < known[:2]:
+                        # Keep the smallest parent, so the result doesn't depend on the number of workers
+                        visited[next_state] = candidate
+            more = any(flags)
+            barrier.wait()
+
+        frontier = next_frontier
+        flags[w] = len(frontier)
+        barrier.wait()
+        remaining = sum(flags)
+        barrier.wait()
+        if remaining == 0:
+            break
+
+    stats = WorkerStats(expanded, len(visited), time.perf_counter() - start_time, _peak_memory_kb())
+    return goal, visited, stats
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    })
+
+    # Check that the same shortest solution is found no matter how many worker processes are used
+    solutions = [solve('game_data.json', 0, processes).commands for processes in (1, 2, 4)]
+    assert solutions[0] is not None and solutions[0] == solutions[1] == solutions[2]
+    assert verify_solution('game_data.json', 0, solutions[0])
+
+    # Check that an invalid world is rejected before any workers are started
+    try:
+        solve('game_data.json', 99)
+        assert False, "solve should reject a missing starting location"
+    except ValueError:
+        pass
+
+    # Check that an empty exchange buffer is rejected instead of never finishing an exchange
+    try:
+        solve('game_data.json', 0, 2, 0)
+        assert False, "solve should reject buffer_records < 1"
+    except ValueError:
+        pass
@@ -0,0 +1,174 @@
+"""CSC111 Project 1: Text Adventure Game - Walkthrough Regression Runner
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains code for Project 1 that checks walkthroughs against their expected
+location id logs, skipping every walkthrough whose result is already known.
+
+Each walkthrough is a JSON file (see the walkthroughs/ directory) with the game data file to play
+in ("world", relative to the current directory), the starting location ("initial_location_id"),
+the commands to simulate ("commands") and the expected id log ("expected_log").
+
+Each result is cached under a key hashed from the world data, the walkthrough, and the engine
+version (a hash of the source of the modules that run simulations). A walkthrough is only run again
+when its key changes, so after a world-only edit only the walkthroughs in that world are run.
+Walkthroughs that do need to run are run in parallel.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import glob
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from multiprocessing import Pool
+from typing import Optional
+
+from simulation import AdventureGameSimulation
+
+# The directory holding the engine modules (this module's directory)
+ENGINE_DIR = os.path.dirname(os.path.abspath(__file__))
+WALKTHROUGH_DIR = "walkthroughs"
+CACHE_FILE = ".regression_cache.json"
+
+# The modules whose source determines the engine version
+ENGINE_MODULES = ["adventure.py", "event_logger.py", "game_entities.py", "simulation.py", "world_validator.py",
+                  "results_store.py"]
+
+
+@dataclass
+class CaseResult:
+    """The result of checking one walkthrough.
+
+    Instance Attributes:
+        - name: The name of the walkthrough's file, without its extension.
+        - key: The cache key of the walkthrough.
+        - passed: Whether the simulated id log matched the expected one.
+        - actual_log: The simulated id log, or None if the simulation failed.
+        - error: A description of why the simulation failed, or '' if it did not.
+        - cached: Whether this result was taken from the cache instead of being run.
+    """
+
+    name: str
+    key: str
+    passed: bool
+    actual_log: Optional[list[int]] = None
+    error: str = ""
+    cached: bool = False
+
+
+def engine_version(root: str = ENGINE_DIR) -> str:
+    """Return a hash of the source of the engine modules in the given directory (by default, the directory of this
+    module, so that the version doesn't depend on the current directory).
+    """
+    digest = hashlib.sha256()
+    for module in ENGINE_MODULES:
+        with open(os.path.join(root, module), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _file_hash(filename: str) -> str:
+    """Return a hash of the contents of the given file, or '' if it can't be read
+    (in which case the walkthroughs in it will fail when they are run).
+    """
+    try:
+        with open(filename, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return ""
+
+
+def case_key(case: dict, world_hash: str, engine: str) -> str:
+    """Return the cache key of the given walkthrough, from the hash of its world data and the engine version."""
+    digest = hashlib.sha256()
+    digest.update(engine.encode())
+    digest.update(world_hash.encode())
+    digest.update(json.dumps(case, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def run_case(name: str, case: dict, key: str) -> CaseResult:
+    """Simulate the given walkthrough and return its result."""
+    try:
+        sim = AdventureGameSimulation(case["world"], case["initial_location_id"], case["commands"])
+    except (OSError, ValueError, KeyError) as error:
+        return CaseResult(name, key, False, error=f"{type(error).__name__}: {error}")
+    actual_log = sim.get_id_log()
+    return CaseResult(name, key, actual_log == case["expected_log"], actual_log)
+
+
+def _run_case_args(args: tuple[str, dict, str]) -> CaseResult:
+    """Call run_case with the given tuple of arguments (for Pool.imap_unordered)."""
+    return run_case(*args)
+
+
+def run_regressions(walkthrough_dir: str = WALKTHROUGH_DIR, cache_file: str = CACHE_FILE,
+                    processes: Optional[int] = None) -> list[CaseResult]:
+    """Check every walkthrough in the given directory and return the results, sorted by name.
+
+    Results for walkthroughs whose key is in the given cache file are reused; the rest are run in parallel by the
+    given number of worker processes (by default, one per CPU), and the cache file is rewritten with the results.
+    """
+    cache = {}
+    if os.path.exists(cache_file):
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+
+    engine = engine_version()
+    world_hashes = {}
+    results = []
+    to_run = []
+    for filename in sorted(glob.glob(os.path.join(walkthrough_dir, "*.json"))):
+        name = os.path.splitext(os.path.basename(filename))[0]
+        with open(filename, 'r') as f:
+            case = json.load(f)
+        world = case["world"]
+        if world not in world_hashes:
+            world_hashes[world] = _file_hash(world)
+        key = case_key(case, world_hashes[world], engine)
+
+        cached = cache.get(key)
+        if cached is not None:
+            results.append(CaseResult(name, key, cached["passed"], cached["actual_log"], cached["error"], True))
+        else:
+            to_run.append((name, case, key))
+
+    if to_run:
+        with Pool(processes) as pool:
+            results.extend(pool.imap_unordered(_run_case_args, to_run))
+        # Only the current walkthroughs' results are kept, so stale keys don't build up
+        cache = {r.key: {"passed": r.passed, "actual_log": r.actual_log, "error": r.error} for r in results}
+        with open(cache_file, 'w') as f:
+            json.dump(cache, f)
+
+    results.sort(key=lambda r: r.name)
+    return results
+
+
+if __name__ == "__main__":
+    for case_result in run_regressions():
+        status = "PASS" if case_result.passed else "FAIL"
+        source = " (cached)" if case_result.cached else ""
+        print(f"{status} {case_result.name}{source} {case_result.error}".rstrip())
+
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    # Note: this is kept out of the command-line path above, so that running the regressions doesn't need python_ta.
+    # import python_ta
+    # python_ta.check_all(config={
+    #     'max-line-length': 120,
+    #     'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    # })
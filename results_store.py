@@ -0,0 +1,178 @@
+"""CSC111 Project 1: Text Adventure Game - Results Store
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains code for Project 1 that saves the outcomes of finished game
+sessions (from the interactive game or from simulations) to a local SQLite database, so that
+they can be queried later, for example for a leaderboard.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import sqlite3
+from collections import Counter
+
+from game_entities import SessionResult
+
+RESULTS_FILE = "results.db"  # Default database file for session results
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    world TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    moves_used INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    id_log TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS visits (
+    session_id INTEGER NOT NULL REFERENCES sessions (id),
+    world TEXT NOT NULL,
+    location_id INTEGER NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_world_score ON sessions (world, score DESC);
+CREATE INDEX IF NOT EXISTS visits_by_world_location ON visits (world, location_id);
+"""
+
+
+class ResultsStore:
+    """A SQLite database of finished game sessions.
+
+    Results are buffered and written in batches, each inside a single transaction, so that simulations can add
+    results at a high rate. Buffered results are not visible to queries (or saved) until they are flushed, which
+    happens automatically when the buffer is full, before each query, and when the store is closed.
+
+    Each session's id log is stored compactly as a comma-separated string, and the number of times it visited each
+    location is stored in an indexed table for per-location queries.
+
+    Several ResultsStores (e.g., in different processes) may write to the same database file: each batch takes
+    SQLite's write lock before choosing its session ids.
+
+    Instance Attributes:
+        - batch_size: The number of results buffered before they are written to the database.
+
+    Representation Invariants:
+        - self.batch_size > 0
+        - len(self._pending) < self.batch_size
+    """
+    # Private Instance Attributes:
+    #   - _connection: the connection to the database.
+    #   - _pending: the results added but not yet written to the database.
+    batch_size: int
+    _connection: sqlite3.Connection
+    _pending: list[SessionResult]
+
+    def __init__(self, db_file: str = RESULTS_FILE, batch_size: int = 1000) -> None:
+        """Open the results database in the given file, creating it if it does not exist."""
+        self.batch_size = batch_size
+        self._connection = sqlite3.connect(db_file)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._pending = []
+
+    def add_result(self, result: SessionResult) -> None:
+        """Add the given session result to the store, writing the buffered results if the buffer is full."""
+        self._pending.append(result)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered results to the database in one transaction.
+
+        The transaction takes the write lock before reading the next free session id, so no other writer can use
+        the same ids. If writing fails, the results stay buffered.
+        """
+        if not self._pending:
+            return
+
+        with self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            next_id = self._connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM sessions").fetchone()[0]
+            session_rows = []
+            visit_rows = []
+            for session_id, result in enumerate(self._pending, next_id):
+                session_rows.append((session_id, result.world, result.score, result.moves_used, int(result.won),
+                                     ",".join(str(loc_id) for loc_id in result.id_log)))
+                for loc_id, count in Counter(result.id_log).items():
+                    visit_rows.append((session_id, result.world, loc_id, count))
+            self._connection.executemany("INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?)", session_rows)
+            self._connection.executemany("INSERT INTO visits VALUES (?, ?, ?, ?)", visit_rows)
+        self._pending = []
+
+    def top_scores(self, world: str, n: int = 10) -> list[SessionResult]:
+        """Return the n highest-scoring session results for the given world, from highest to lowest score."""
+        self.flush()
+        rows = self._connection.execute(
+            "SELECT world, score, moves_used, won, id_log FROM sessions WHERE world = ? ORDER BY score DESC LIMIT ?",
+            (world, n)
+        )
+        return [SessionResult(row[0], row[1], row[2], bool(row[3]),
+                              [int(loc_id) for loc_id in row[4].split(",")] if row[4] else [])
+                for row in rows]
+
+    def location_visits(self, world: str, loc_id: int) -> tuple[int, int]:
+        """Return the number of sessions in the given world that visited the given location,
+        and the total number of times they visited it.
+        """
+        self.flush()
+        row = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(count), 0) FROM visits WHERE world = ? AND location_id = ?",
+            (world, loc_id)
+        ).fetchone()
+        return (row[0], row[1])
+
+    def close(self) -> None:
+        """Write any buffered results and close the database. The database is closed even if writing fails."""
+        try:
+            self.flush()
+        finally:
+            self._connection.close()
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    })
+
+    # Check that two stores can write to the same file, and that queries see both stores' results
+    import os
+    import tempfile
+    from simulation import AdventureGameSimulation
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "results.db")
+        store_a = ResultsStore(db_path, batch_size=2)
+        store_b = ResultsStore(db_path, batch_size=2)
+        store_a.add_result(SessionResult("w", 10, 5, False, [0, 1, 0]))
+        store_b.add_result(SessionResult("w", 30, 7, True, [0, 1, 4, 1, 0]))
+        store_a.add_result(SessionResult("w", 20, 6, False, [0, 1]))  # Fills store_a's batch
+        store_b.close()
+        assert [r.score for r in store_a.top_scores("w", 2)] == [30, 20]
+        assert store_a.location_visits("w", 1) == (3, 4)
+        assert store_a.location_visits("w", 4) == (1, 1)
+        store_a.close()
+
+    # Check that a simulation's result is scored by the real game rules
+    enhancement_demo = ["go east", "go east", "go south", "take key", "use key", "go south", "take lucky mug",
+                        "go north", "go north", "go west", "go west", "drop lucky mug"]
+    enhancement_sim = AdventureGameSimulation('game_data.json', 0, enhancement_demo)
+    sim_result = enhancement_sim.get_result('game_data.json')
+    assert (sim_result.score, sim_result.moves_used, sim_result.won) == (80, 12, False)
+    assert sim_result.id_log == enhancement_sim.get_id_log()
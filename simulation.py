@@ -22,9 +22,11 @@ please consult our Course Syllabus.
 This file is Copyright (c) 2026 CSC111 Teaching Team
 """
 from __future__ import annotations
+from typing import Optional
+
 from event_logger import Event, EventList
 from adventure import AdventureGame
-from game_entities import Location
+from game_entities import Location, SessionResult, World
 
 
 class AdventureGameSimulation:
@@ -36,16 +38,19 @@ class AdventureGameSimulation:
     _game: AdventureGame
     _events: EventList
 
-    def __init__(self, game_data_file: str, initial_location_id: int, commands: list[str]) -> None:
+    def __init__(self, game_data_file: str, initial_location_id: int, commands: list[str],
+                 world: Optional[World] = None) -> None:
         """
         Initialize a new game simulation based on the given game data, that runs through the given commands.
+        If world is given, it must be the World already loaded from game_data_file, and is used instead of reading
+        the file again (see AdventureGame.__init__).
 
         Preconditions:
         - len(commands) > 0
         - all commands in the given list are valid commands when starting from the location at initial_location_id
         """
         self._events = EventList()
-        self._game = AdventureGame(game_data_file, initial_location_id)
+        self._game = AdventureGame(game_data_file, initial_location_id, world)
 
         # Hint: self._game.get_location() gives you back the current location
         initial_location = self._game.get_location()
@@ -55,70 +60,34 @@ class AdventureGameSimulation:
         # Hint: Call self.generate_events with the appropriate arguments
         self.generate_events(commands, initial_location)
 
-    def _handle_take(self, command: str, current_location: Location) -> None:
-        """Handle a 'take' command during simulation, picking up an item at the current location."""
-        item_name = command[5:].strip()
-        if item_name in current_location.items:
-            current_location.items.remove(item_name)
-            item = self._game.get_item_by_name(item_name)
-            if item:
-                self._game.player.inventory.append(item)
-        if self._events.last is not None:
-            self._events.last.next_command = command
-
-    def _handle_drop(self, command: str, current_location: Location) -> None:
-        """Handle a 'drop' command during simulation, dropping an item at the current location."""
-        item_name = command[5:].strip()
-        inventory_names = self._game.get_inventory_names()
-        if item_name in inventory_names:
-            self._game.player.inventory = [i for i in self._game.player.inventory if i.name != item_name]
-            item = self._game.get_item_by_name(item_name)
-            if item and current_location.id_num != item.target_position:
-                current_location.items.append(item_name)
-        if self._events.last is not None:
-            self._events.last.next_command = command
-
-    def _handle_use(self, command: str, current_location: Location) -> None:
-        """Handle a 'use' command during simulation, using a special item like a key."""
-        item_name = command[4:].strip()
-        if item_name == "key" and current_location.id_num == 5:
-            office = self._game.get_location(8)
-            office.locked = False
-            self._game.player.inventory = [i for i in self._game.player.inventory if i.name != "key"]
-        if self._events.last is not None:
-            self._events.last.next_command = command
-
     def generate_events(self, commands: list[str], current_location: Location) -> None:
         """
         Generate events in this simulation, based on current_location and commands, a valid list of commands.
 
+        Movement, take, drop and use commands are applied by the simulation's game with the real game rules (scoring,
+        locked doors and the move limit), so the game's score and moves used match the events. As in the interactive
+        game, the commands after the game ends (by winning, losing or quitting) are ignored.
+
         Preconditions:
         - len(commands) > 0
         - all commands in the given list are valid commands when starting from current_location
         """
 
         for command in commands:
-            # Handle movement commands (go north/south/east/west)
-            if command in current_location.available_commands:
-                next_location_id = current_location.available_commands[command]
-                self._game.current_location_id = next_location_id
-                current_location = self._game.get_location()
+            if self._game.check_win_condition() or self._game.check_lose_condition():
+                break
 
-                new_event = Event(current_location.id_num, current_location.long_description)
-                self._events.add_event(new_event, command)
+            # Handle movement, take, drop and use commands, which add an event when the player moves
+            if command in current_location.available_commands or command.startswith(("take ", "drop ", "use ")):
+                self._game.apply_command(command, self._events)
+                current_location = self._game.get_location()
 
             # Handle non-movement menu commands
             elif command in ["look", "inventory", "score", "log", "quit"]:
                 if self._events.last is not None:
-                    self._events.last.next_command = command
-
-            # Handle item commands via helper methods
-            elif command.startswith("take "):
-                self._handle_take(command, current_location)
-            elif command.startswith("drop "):
-                self._handle_drop(command, current_location)
-            elif command.startswith("use "):
-                self._handle_use(command, current_location)
+                    self._events.set_last_command(command)
+                if command == "quit":
+                    break
 
     def get_id_log(self) -> list[int]:
         """
@@ -129,6 +98,14 @@ class AdventureGameSimulation:
 
         return self._events.get_id_log()
 
+    def check_win_condition(self) -> bool:
+        """Return whether the game is won at the end of this simulation."""
+        return self._game.check_win_condition()
+
+    def get_result(self, world: str) -> SessionResult:
+        """Return the outcome of this simulation's commands, labelled with the given world name."""
+        return self._game.get_result(world, self._events)
+
     def run(self) -> None:
         """
         Run the game simulation and log location descriptions.
@@ -182,7 +159,7 @@ if __name__ == "__main__":
     ]  # Create a list of all the commands needed to walk through your game to win it
     expected_log_win = [0, 1, 4, 3, 6, 3, 4, 7, 4, 5, 8, 5, 2, 1, 0]
     # Uncomment the line below to test your walkthrough
-    sim = AdventureGameSimulation('game_data.json', 1, win_walkthrough)
+    sim = AdventureGameSimulation('game_data.json', 0, win_walkthrough)
     assert expected_log_win == sim.get_id_log()
 
     # Create a list of all the commands needed to walk through your game to reach a 'game over' state
@@ -210,7 +187,7 @@ if __name__ == "__main__":
     ]
     expected_log_lose = [0] + [1, 0] * 20
     # Uncomment the line below to test your demo
-    sim = AdventureGameSimulation('game_data.json', 1, lose_demo)
+    sim = AdventureGameSimulation('game_data.json', 0, lose_demo)
     assert expected_log_lose == sim.get_id_log()
 
     inventory_demo = [
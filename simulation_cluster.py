@@ -0,0 +1,381 @@
+"""CSC111 Project 1: Text Adventure Game - Simulation Cluster
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains code for Project 1 that runs large batches of game simulations
+(every walkthrough against every world) across many worker processes, which may be on other
+machines. A coordinator shares a job queue, a queue of started job IDs and a result queue over
+TCP; workers take jobs, say which ones they have started, run them with AdventureGameSimulation,
+and send back the results.
+
+To run a worker on another machine, call run_worker with the coordinator's address and authkey.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import multiprocessing
+import os
+import queue
+import socket
+import time
+from dataclasses import dataclass, field
+from multiprocessing.managers import BaseManager
+from typing import Optional
+
+from adventure import AdventureGame
+from game_entities import SessionResult
+from results_store import ResultsStore
+from simulation import AdventureGameSimulation
+
+DEFAULT_AUTHKEY = b"csc111-adventure"
+
+class _QueueManager(BaseManager):
+    """The manager that shares the job, started and result queues over TCP.
+
+    The queues are class attributes, so that the manager's server process has exactly one of each; they are only
+    used inside that process. Use _queue_manager to create a manager with the queues registered.
+    """
+    job_queue = queue.Queue()
+    started_queue = queue.Queue()
+    result_queue = queue.Queue()
+
+    @staticmethod
+    def get_job_queue() -> queue.Queue:
+        """Return the shared job queue."""
+        return _QueueManager.job_queue
+
+    @staticmethod
+    def get_started_queue() -> queue.Queue:
+        """Return the shared queue of the IDs of the jobs that workers have started."""
+        return _QueueManager.started_queue
+
+    @staticmethod
+    def get_result_queue() -> queue.Queue:
+        """Return the shared result queue."""
+        return _QueueManager.result_queue
+
+
+def _queue_manager(address: tuple[str, int], authkey: bytes) -> _QueueManager:
+    """Return a new (not yet started or connected) manager for the shared queues at the given address."""
+    _QueueManager.register('jobs', callable=_QueueManager.get_job_queue)
+    _QueueManager.register('started', callable=_QueueManager.get_started_queue)
+    _QueueManager.register('results', callable=_QueueManager.get_result_queue)
+    return _QueueManager(address=address, authkey=authkey)
+
+
+@dataclass
+class SimulationJob:
+    """One simulation to run: a walkthrough (list of commands) in a world (game data file).
+
+    Instance Attributes:
+        - job_id: The unique ID of this job.
+        - world: The name of the game data file to run the walkthrough in.
+        - initial_location_id: The location ID the walkthrough starts at.
+        - commands: The walkthrough's commands.
+        - attempt: The number of times this job has been queued before.
+    """
+
+    job_id: int
+    world: str
+    initial_location_id: int
+    commands: list[str]
+    attempt: int = 0
+
+
+@dataclass
+class JobResult:
+    """The result of running one SimulationJob.
+
+    Instance Attributes:
+        - job_id: The ID of the job that was run.
+        - worker: The name of the worker that ran the job.
+        - elapsed: The number of seconds the worker spent on the job.
+        - result: The outcome of the simulation, or None if the job failed.
+        - error: A description of why the job failed, or '' if it succeeded.
+    """
+
+    job_id: int
+    worker: str
+    elapsed: float
+    result: Optional[SessionResult] = None
+    error: str = ""
+
+
+@dataclass
+class ClusterReport:
+    """The merged results of a batch of simulation jobs, with per-worker statistics.
+
+    Instance Attributes:
+        - results: The successful result of each job, sorted by job ID.
+        - failed: The failed result of each job that ran out of retries, sorted by job ID.
+        - elapsed: The number of seconds from submitting the batch to receiving its last result.
+        - jobs_per_worker: The number of results each worker sent back (including failures and duplicates).
+        - busy_time: The number of seconds each worker spent running jobs.
+        - straggler_time: The number of seconds between the first worker sending back its last result,
+                          and the last result of the batch arriving.
+    """
+
+    results: list[JobResult] = field(default_factory=list)
+    failed: list[JobResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    jobs_per_worker: dict[str, int] = field(default_factory=dict)
+    busy_time: dict[str, float] = field(default_factory=dict)
+    straggler_time: float = 0.0
+
+    def throughput(self, worker: str) -> float:
+        """Return the number of jobs per second the given worker ran while busy."""
+        busy = self.busy_time.get(worker, 0.0)
+        return self.jobs_per_worker.get(worker, 0) / busy if busy > 0 else 0.0
+
+    def summary(self) -> str:
+        """Return a human-readable summary of this report."""
+        lines = [f"{len(self.results)} job(s) succeeded and {len(self.failed)} failed in {self.elapsed:.2f}s "
+                 f"(straggler time {self.straggler_time:.2f}s)"]
+        for worker in sorted(self.jobs_per_worker):
+            lines.append(f"  {worker}: {self.jobs_per_worker[worker]} job(s), "
+                         f"{self.throughput(worker):.1f} jobs/s while busy")
+        return "\n".join(lines)
+
+
+class Coordinator:
+    """A coordinator that shards simulation jobs over a shared TCP job queue and merges the workers' results.
+
+    A job whose result reports an error is queued again, up to max_retries times. If no result at all arrives for
+    timeout seconds, this counts as a retry of every job without a result: a job that a worker has started (e.g., a
+    worker that died holding it) is queued again, while a job that is still waiting in the queue (e.g., because no
+    workers are connected) is left there. Jobs that have run out of retries fail. Any duplicate results that arrive
+    later are ignored.
+
+    Instance Attributes:
+        - address: The (host, port) the coordinator's queues are served at.
+        - authkey: The key workers must use to connect.
+        - max_retries: The number of times a failed job is queued again.
+        - timeout: The number of seconds to wait for a result before retrying every unfinished job.
+        - store: The ResultsStore that the result of each successful job is added to as it arrives (and which is
+                 flushed at the end of each run), or None if results are not stored.
+    """
+    # Private Instance Attributes:
+    #   - _manager: the manager serving the shared queues.
+    #   - _workers: the local worker processes started by self.start_local_workers.
+    address: tuple[str, int]
+    authkey: bytes
+    max_retries: int
+    timeout: float
+    store: Optional[ResultsStore]
+    _manager: _QueueManager
+    _workers: list[multiprocessing.Process]
+
+    def __init__(self, address: tuple[str, int] = ("127.0.0.1", 0), authkey: bytes = DEFAULT_AUTHKEY,
+                 max_retries: int = 2, timeout: float = 60.0, store: Optional[ResultsStore] = None) -> None:
+        """Start serving the shared job and result queues at the given address (port 0 picks a free port)."""
+        self._manager = _queue_manager(address, authkey)
+        self._manager.start()
+        self.address = self._manager.address
+        self.authkey = authkey
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.store = store
+        self._workers = []
+
+    def start_local_workers(self, n: int) -> None:
+        """Start n worker processes on this machine."""
+        for i in range(n):
+            process = multiprocessing.Process(target=run_worker, args=(self.address, self.authkey, f"local-{i}"),
+                                              daemon=True)
+            process.start()
+            self._workers.append(process)
+
+    def run(self, jobs: list[SimulationJob]) -> ClusterReport:
+        """Run the given jobs on the connected workers and return the merged report.
+
+        Preconditions:
+            - all job IDs in jobs are unique
+        """
+        job_queue, started_queue, result_queue = self._manager.jobs(), self._manager.started(), self._manager.results()
+        pending = {job.job_id: job for job in jobs}
+        started = set()
+        report = ClusterReport()
+        last_result_times = {}
+
+        start = time.perf_counter()
+        for job in jobs:
+            job_queue.put(job)
+
+        while pending:
+            try:
+                job_result = result_queue.get(timeout=self.timeout)
+            except queue.Empty:
+                started.update(_drain(started_queue))
+                for job in list(pending.values()):
+                    if job.attempt < self.max_retries:
+                        job.attempt += 1
+                        if job.job_id in started:
+                            # Only a started job is queued again; a job that hasn't been started is still queued
+                            started.discard(job.job_id)
+                            job_queue.put(job)
+                    else:
+                        report.failed.append(JobResult(job.job_id, "", 0.0,
+                                                       error=f"No result after {self.timeout}s"))
+                        pending.pop(job.job_id)
+                continue
+
+            worker = job_result.worker
+            report.jobs_per_worker[worker] = report.jobs_per_worker.get(worker, 0) + 1
+            report.busy_time[worker] = report.busy_time.get(worker, 0.0) + job_result.elapsed
+            last_result_times[worker] = time.perf_counter()
+
+            job = pending.get(job_result.job_id)
+            if job is None:
+                continue  # A duplicate result for a job that was queued again
+            if not job_result.error:
+                report.results.append(job_result)
+                pending.pop(job.job_id)
+                if self.store is not None:
+                    self.store.add_result(job_result.result)
+            elif job.attempt < self.max_retries:
+                job.attempt += 1
+                started.discard(job.job_id)
+                job_queue.put(job)
+            else:
+                report.failed.append(job_result)
+                pending.pop(job.job_id)
+
+        if self.store is not None:
+            self.store.flush()
+        end = time.perf_counter()
+        report.elapsed = end - start
+        if last_result_times:
+            report.straggler_time = end - min(last_result_times.values())
+        report.results.sort(key=lambda r: r.job_id)
+        report.failed.sort(key=lambda r: r.job_id)
+        return report
+
+    def shutdown(self) -> None:
+        """Stop the local workers and stop serving the shared queues."""
+        job_queue = self._manager.jobs()
+        for _ in self._workers:
+            job_queue.put(None)
+        for process in self._workers:
+            process.join()
+        self._workers = []
+        self._manager.shutdown()
+
+
+def run_worker(address: tuple[str, int], authkey: bytes = DEFAULT_AUTHKEY, name: Optional[str] = None) -> None:
+    """Run simulation jobs from the coordinator at the given address until it sends None or shuts down.
+
+    Each world is loaded (and validated) only once and kept for later jobs in the same world. A job that raises any
+    error is sent back as a failed JobResult, so one bad job can't stop the worker.
+    """
+    if name is None:
+        name = f"{socket.gethostname()}-{os.getpid()}"
+    manager = _queue_manager(address, authkey)
+    manager.connect()
+    job_queue, started_queue, result_queue = manager.jobs(), manager.started(), manager.results()
+    worlds = {}
+
+    while True:
+        try:
+            job = job_queue.get()
+        except (EOFError, OSError):
+            return  # The coordinator has shut down
+        if job is None:
+            return
+        started_queue.put(job.job_id)
+
+        start = time.perf_counter()
+        try:
+            if job.world not in worlds:
+                worlds[job.world] = AdventureGame.load_world(job.world)
+            sim = AdventureGameSimulation(job.world, job.initial_location_id, job.commands, worlds[job.world])
+            job_result = JobResult(job.job_id, name, 0.0, sim.get_result(job.world))
+        except Exception as error:  # Any error in one job (e.g., from malformed data) only fails that job
+            job_result = JobResult(job.job_id, name, 0.0, error=f"{type(error).__name__}: {error}")
+        job_result.elapsed = time.perf_counter() - start
+        result_queue.put(job_result)
+
+
+def _drain(shared_queue: queue.Queue) -> list:
+    """Remove and return every item currently in the given shared queue, without waiting."""
+    items = []
+    while True:
+        try:
+            items.append(shared_queue.get_nowait())
+        except queue.Empty:
+            return items
+
+
+def run_batch(worlds: list[str], walkthroughs: list[tuple[int, list[str]]], num_workers: int,
+              results_file: Optional[str] = None) -> ClusterReport:
+    """Run every walkthrough (a starting location ID and its commands) against every world on num_workers local
+    worker processes, and return the merged report.
+
+    If results_file is given, the result of every successful job is also saved to the ResultsStore database in that
+    file, in batches as the results arrive.
+    """
+    jobs = [SimulationJob(i * len(walkthroughs) + j, world, initial_location_id, commands)
+            for i, world in enumerate(worlds)
+            for j, (initial_location_id, commands) in enumerate(walkthroughs)]
+    store = ResultsStore(results_file) if results_file is not None else None
+    coordinator = Coordinator(store=store)
+    coordinator.start_local_workers(num_workers)
+    try:
+        return coordinator.run(jobs)
+    finally:
+        coordinator.shutdown()
+        if store is not None:
+            store.close()
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    })
+
+    # Check that jobs that get no result are retried max_retries times and then fail, instead of waiting forever
+    idle_coordinator = Coordinator(max_retries=1, timeout=0.2)
+    try:
+        idle_report = idle_coordinator.run([SimulationJob(0, 'game_data.json', 0, ["go east"])])
+    finally:
+        idle_coordinator.shutdown()
+    assert idle_report.results == [] and [r.job_id for r in idle_report.failed] == [0]
+
+    import tempfile
+
+    # Check that jobs in a missing world fail while the others still succeed, and only successes are stored
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "results.db")
+        batch_report = run_batch(['game_data.json', 'missing_world.json'], [(0, ["go east", "go west"])], 2,
+                                 db_path)
+        assert [r.job_id for r in batch_report.results] == [0]
+        assert [r.job_id for r in batch_report.failed] == [1]
+        results = ResultsStore(db_path)
+        assert [r.id_log for r in results.top_scores('game_data.json')] == [[0, 1, 0]]
+        assert results.top_scores('missing_world.json') == []
+        results.close()
+
+    # Check that a malformed job fails without killing its worker, which goes on to run the next job
+    one_worker = Coordinator(max_retries=0, timeout=30.0)
+    one_worker.start_local_workers(1)
+    try:
+        malformed_report = one_worker.run([SimulationJob(0, 'game_data.json', 0, None),
+                                           SimulationJob(1, 'game_data.json', 0, ["go east"])])
+    finally:
+        one_worker.shutdown()
+    assert [r.job_id for r in malformed_report.failed] == [0] and 'TypeError' in malformed_report.failed[0].error
+    assert [r.job_id for r in malformed_report.results] == [1]
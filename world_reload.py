@@ -0,0 +1,249 @@
+"""CSC111 Project 1: Text Adventure Game - World Hot Reload
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains code for Project 1 that watches a game data file for changes
+and swaps the changed world data into games that are already in progress, without restarting
+them or losing their state.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+import os
+import threading
+from typing import Optional
+
+from adventure import AdventureGame, WINNING_LOCATION
+from game_entities import World, WorldDiff
+from world_validator import validate_world
+
+
+def diff_worlds(old: World, new: World) -> WorldDiff:
+    """Return the changes needed to turn the static data of the old world into that of the new world.
+
+    Locations are compared by their descriptions and available commands only; see WorldDiff.
+    """
+    diff = WorldDiff(max_moves=new.max_moves, winning_items=list(new.winning_items))
+
+    for loc_id, new_loc in new.locations.items():
+        old_loc = old.locations.get(loc_id)
+        if old_loc is None or (old_loc.brief_description, old_loc.long_description, old_loc.available_commands) \
+                != (new_loc.brief_description, new_loc.long_description, new_loc.available_commands):
+            diff.locations[loc_id] = new_loc
+    diff.removed_locations = [loc_id for loc_id in old.locations if loc_id not in new.locations]
+
+    old_items = {item.name: item for item in old.items}
+    new_items = {item.name: item for item in new.items}
+    diff.items = {name: item for name, item in new_items.items() if old_items.get(name) != item}
+    diff.removed_items = [name for name in old_items if name not in new_items]
+
+    diff.rules = {key: rule for key, rule in new.rules.items() if old.rules.get(key) != rule}
+    diff.removed_rules = [key for key in old.rules if key not in new.rules]
+
+    return diff
+
+
+class WorldWatcher:
+    """A watcher that hot-reloads a game data file into the games registered with it.
+
+    When the file changes, the new world is loaded and diffed against the previously loaded one outside of the lock,
+    so games keep running in the meantime. The diff is then applied to every registered game while holding the lock.
+
+    Instance Attributes:
+        - filename: The name of the game data file being watched.
+        - interval: The number of seconds between checks for changes when running in the background.
+        - initial_location_id: The starting location ID each reloaded world is validated for.
+        - errors: The validation errors of the last version of the file that was rejected, or [] if the last
+                  version was applied.
+        - lock: The lock held while a reload is applied. Hold it while applying a command to a registered game,
+                so that the game never sees a partially applied reload.
+
+    Representation Invariants:
+        - self.interval > 0
+    """
+    # Private Instance Attributes:
+    #   - _world: the World data most recently loaded from the file.
+    #   - _stamp: the (modification time, size) of the file when _world was loaded.
+    #   - _games: the games that reloads are applied to.
+    #   - _stopped: set to stop the background thread.
+    #   - _thread: the background thread checking for changes, if started.
+    filename: str
+    interval: float
+    initial_location_id: int
+    errors: list[str]
+    lock: threading.Lock
+    _world: World
+    _stamp: tuple[int, int]
+    _games: list[AdventureGame]
+    _stopped: threading.Event
+    _thread: Optional[threading.Thread]
+
+    def __init__(self, filename: str, interval: float = 1.0, initial_location_id: int = 0) -> None:
+        """Initialize a new watcher for the given game data file, with no registered games.
+
+        Preconditions:
+            - filename is the filename of a valid game data JSON file
+        """
+        self.filename = filename
+        self.interval = interval
+        self.initial_location_id = initial_location_id
+        self.errors = []
+        self.lock = threading.Lock()
+        self._stamp = self._file_stamp()
+        self._world = AdventureGame.load_world(filename)
+        self._games = []
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def register(self, game: AdventureGame) -> None:
+        """Apply future reloads of the watched file to the given game."""
+        with self.lock:
+            self._games.append(game)
+
+    def unregister(self, game: AdventureGame) -> None:
+        """Stop applying reloads of the watched file to the given game, if it was registered."""
+        with self.lock:
+            if game in self._games:
+                self._games.remove(game)
+
+    def check(self) -> Optional[WorldDiff]:
+        """Reload the watched file if it has changed since it was last loaded, apply the changes to every registered
+        game, and return them. Return None if the file has not changed, or cannot be loaded yet (for example, because
+        it is partway through being written); in that case it is tried again on the next check.
+
+        A new version of the file that fails validate_world is rejected: it is not applied, its errors are stored in
+        self.errors, and None is returned. It is not tried again until the file changes again.
+        """
+        try:
+            stamp = self._file_stamp()
+            if stamp == self._stamp:
+                return None
+            new_world = AdventureGame.load_world(self.filename)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        report = validate_world(new_world, self.initial_location_id, WINNING_LOCATION)
+        self._stamp = stamp
+        if not report.is_valid():
+            self.errors = report.errors
+            return None
+        self.errors = []
+
+        diff = diff_worlds(self._world, new_world)
+        with self.lock:
+            for game in self._games:
+                game.apply_world_diff(diff)
+        self._world = new_world
+        return diff
+
+    def start(self) -> None:
+        """Start checking the watched file for changes every self.interval seconds in a background thread."""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._watch, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread started by self.start, if any, and wait for it to finish."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self) -> None:
+        """Check the watched file for changes until self.stop is called."""
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def _file_stamp(self) -> tuple[int, int]:
+        """Return the modification time and size of the watched file."""
+        stat = os.stat(self.filename)
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    })
+
+    import json
+    import shutil
+    import tempfile
+    from event_logger import Event, EventList
+
+    def _rewrite(filename: str, data: dict) -> None:
+        """Write the given game data to the given file, making sure its modification time changes."""
+        stamp = os.stat(filename).st_mtime_ns
+        with open(filename, 'w') as data_file:
+            json.dump(data, data_file)
+        os.utime(filename, ns=(stamp + 1_000_000, stamp + 1_000_000))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        world_file = os.path.join(temp_dir, 'game_data.json')
+        shutil.copy('game_data.json', world_file)
+        with open(world_file, 'r') as f:
+            game_data = json.load(f)
+
+        game = AdventureGame(world_file, 0)
+        game_log = EventList()
+        game_log.add_event(Event(0, game.get_location().long_description))
+        watcher = WorldWatcher(world_file)
+        watcher.register(game)
+        for command in ["go east", "go east", "go south", "take key"]:
+            game.apply_command(command, game_log)
+
+        # Check that a reload keeps the game's state, and that raising max_moves gives the player more moves
+        game_data['max_moves'] = 60
+        _rewrite(world_file, game_data)
+        assert watcher.check() is not None and watcher.errors == []
+        assert game.current_location_id == 5 and game.get_inventory_names() == ['key']
+        assert game.player.moves_remaining == 56 and game.get_result(world_file, game_log).moves_used == 4
+
+        game.apply_command("use key", game_log)
+        game.apply_command("go north", game_log)
+        assert game.player.score == 40 and not game.get_location(8).locked
+
+        # Check that removing the player's current location (2) keeps it, with its old exits, until they leave
+        locations_by_id = {loc['id']: loc for loc in game_data['locations']}
+        del locations_by_id[1]['available_commands']['go east']
+        del locations_by_id[5]['available_commands']['go north']
+        game_data['locations'] = [loc for loc in game_data['locations'] if loc['id'] != 2]
+        _rewrite(world_file, game_data)
+        assert watcher.check() is not None and watcher.errors == []
+        assert game.current_location_id == 2 and game.get_location().available_commands == {'go west': 1,
+                                                                                            'go south': 5}
+        assert game.player.score == 40 and not game.get_location(8).locked and not game.check_win_condition()
+        game.apply_command("go south", game_log)
+        assert game.current_location_id == 5 and 'go north' not in game.get_location().available_commands
+        game.undo(game_log)
+        assert game.current_location_id == 2 and game_log.get_id_log() == [0, 1, 2, 5, 2]
+        assert game.get_result(world_file, game_log).moves_used == 6
+
+        # Check that an invalid version of the file is rejected, and that the background thread applies reloads
+        _rewrite(world_file, {**game_data, 'winning_items': ['missing item']})
+        assert watcher.check() is None and watcher.errors != [] and game.winning_items != ['missing item']
+        watcher.interval = 0.05
+        watcher.start()
+        _rewrite(world_file, {**game_data, 'max_moves': 50})
+        for _ in range(100):
+            with watcher.lock:
+                if game.max_moves == 50:
+                    break
+            threading.Event().wait(0.05)
+        watcher.stop()
+        assert game.max_moves == 50 and game.player.moves_remaining == 44
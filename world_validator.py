@@ -0,0 +1,254 @@
+"""CSC111 Project 1: Text Adventure Game - World Validator
+
+Instructions (READ THIS FIRST!)
+===============================
+
+This Python module contains code for Project 1 that checks a game world for problems when it
+is loaded (exits leading nowhere, locations that can't be reached, items that can't be
+delivered, and winning conditions that can't be met), so that a bad game data file fails
+right away instead of partway through a game.
+
+All checks run in time linear in the number of locations plus the number of exits. Whether each
+winning item can be carried to its target location is checked exactly for at most
+MAX_TARGET_SEARCHES distinct target locations (besides the winning location), with one backwards
+search each; items with other targets only get a weaker check, so that worlds with many targets
+stay linear.
+
+Copyright and Usage Information
+===============================
+
+This file is provided solely for the personal and private use of students
+taking CSC111 at the University of Toronto St. George campus. All forms of
+distribution of this code, whether as given or with any changes, are
+expressly prohibited. For more information on copyright for CSC111 materials,
+please consult our Course Syllabus.
+
+This file is Copyright (c) 2026 CSC111 Teaching Team
+"""
+from __future__ import annotations
+from collections import deque
+from typing import Iterable
+
+from game_entities import ValidationReport, World
+
+# The maximum number of location IDs listed in one message of a ValidationReport
+MAX_LISTED_IDS = 10
+
+# The maximum number of distinct winning item targets (besides the winning location) searched backwards from
+MAX_TARGET_SEARCHES = 4
+
+
+def validate_world(world: World, start_id: int, winning_id: int) -> ValidationReport:
+    """Return a ValidationReport of the given world for a game starting at start_id, where the winning items must
+    be brought back to winning_id.
+
+    The report is cached in world.validation, so checking the same world, starting location and winning location
+    again is O(1).
+
+    A locked location is treated as enterable if some puzzle rule unlocks it. The min_moves of the report is a lower
+    bound: the moves needed to fetch and deposit the farthest winning item on its own, plus one move to take and one
+    to drop each winning item.
+    """
+    if (start_id, winning_id) in world.validation:
+        return world.validation[(start_id, winning_id)]
+
+    report = ValidationReport()
+    world.validation[(start_id, winning_id)] = report
+    locations = world.locations
+    if start_id not in locations:
+        report.errors.append(f"The starting location {start_id} does not exist.")
+        return report
+    if winning_id not in locations:
+        report.errors.append(f"The winning location {winning_id} does not exist.")
+        return report
+
+    unlockable = set()
+    for (item_name, loc_id), rule in world.rules.items():
+        if loc_id not in locations:
+            report.warnings.append(f"The rule for using {item_name} at location {loc_id} is at a missing location.")
+        if rule.unlocks != -1:
+            if rule.unlocks in locations:
+                unlockable.add(rule.unlocks)
+            else:
+                report.errors.append(f"The rule for using {item_name} at location {loc_id} "
+                                     f"unlocks missing location {rule.unlocks}.")
+
+    # Build the location graph (and its reverse), leaving out exits into locations that can never be unlocked
+    adjacency = {loc_id: [] for loc_id in locations}
+    reverse = {loc_id: [] for loc_id in locations}
+    for loc_id, location in locations.items():
+        if location.locked and loc_id not in unlockable:
+            report.warnings.append(f"Location {loc_id} is locked and no rule unlocks it.")
+        for command, target in location.available_commands.items():
+            if target not in locations:
+                report.errors.append(f"The command '{command}' at location {loc_id} leads to missing location "
+                                     f"{target}.")
+            elif not locations[target].locked or target in unlockable:
+                adjacency[loc_id].append(target)
+                reverse[target].append(loc_id)
+
+    distances = _bfs_distances(adjacency, start_id)
+    report.reachable = set(distances)
+    unreachable = [loc_id for loc_id in locations if loc_id not in distances]
+    if unreachable:
+        report.warnings.append(f"{len(unreachable)} location(s) can't be reached from location {start_id}: "
+                               f"{_list_ids(unreachable)}")
+
+    components, component_of = _strongly_connected_components(adjacency, distances)
+    is_sink = [True] * len(components)
+    for loc_id, component_id in component_of.items():
+        if any(component_of[target] != component_id for target in adjacency[loc_id]):
+            is_sink[component_id] = False
+    for component, sink in zip(components, is_sink):
+        if sink and winning_id not in component:
+            report.warnings.append(f"Once entered, location(s) {_list_ids(component)} can't be left "
+                                   f"to get back to location {winning_id}.")
+
+    _check_items(world, report, distances, reverse, component_of, winning_id)
+    return report
+
+
+def _check_items(world: World, report: ValidationReport, distances: dict[int, int], reverse: dict[int, list[int]],
+                 component_of: dict[int, int], winning_id: int) -> None:
+    """Add to the given report the problems with the items in the given world, and set its min_moves.
+    distances maps each reachable location to its distance from the starting location, reverse maps each location
+    to the locations with an exit into it, and component_of maps each reachable location to its strongly connected
+    component (numbered in reverse topological order, as by _strongly_connected_components).
+
+    This runs one breadth-first search backwards from the winning location, and one from each of the first
+    MAX_TARGET_SEARCHES other distinct target locations of winning items. For an item whose target wasn't searched
+    from, carrying it is only checked against the component order (which can miss that it can't be done), and the
+    distance it is carried is bounded below using the distances from the starting location.
+    """
+    items = {item.name: item for item in world.items}
+    distances_to = {winning_id: _bfs_distances(reverse, winning_id)}
+    winnable = winning_id in distances
+    if not winnable:
+        report.errors.append(f"Location {winning_id} can't be reached, so the game can't be won.")
+    longest_errand = distances.get(winning_id, 0)
+
+    for item_name in world.winning_items:
+        item = items.get(item_name)
+        if item is None:
+            report.errors.append(f"Winning item {item_name} does not exist.")
+            winnable = False
+            continue
+
+        start, target = item.start_position, item.target_position
+        if target not in world.locations:
+            report.errors.append(f"Winning item {item_name} has no target location to be deposited at.")
+            winnable = False
+            continue
+        if target not in distances_to and len(distances_to) <= MAX_TARGET_SEARCHES:
+            distances_to[target] = _bfs_distances(reverse, target)
+        searched = target in distances_to
+
+        if start not in distances:
+            report.errors.append(f"Winning item {item_name} at location {start} can't be reached.")
+            winnable = False
+        elif (searched and start not in distances_to[target]) or \
+                (not searched and (target not in component_of or component_of[target] > component_of[start])):
+            report.errors.append(f"Winning item {item_name} can't be carried from location {start} "
+                                 f"to its target location {target}.")
+            winnable = False
+        elif target not in distances_to[winning_id]:
+            report.errors.append(f"After depositing winning item {item_name} at location {target}, "
+                                 f"location {winning_id} can't be reached.")
+            winnable = False
+        elif searched:
+            errand = distances[start] + distances_to[target][start] + distances_to[winning_id][target]
+            longest_errand = max(longest_errand, errand)
+        else:
+            # The target is at least distances[target] moves from the starting location, even via the item
+            errand = max(distances[start], distances[target]) + distances_to[winning_id][target]
+            longest_errand = max(longest_errand, errand)
+
+    if winnable:
+        report.min_moves = longest_errand + 2 * len(world.winning_items)
+        if report.min_moves > world.max_moves:
+            report.errors.append(f"Winning needs at least {report.min_moves} moves, "
+                                 f"but only {world.max_moves} are allowed.")
+
+
+def _bfs_distances(adjacency: dict[int, list[int]], source: int) -> dict[int, int]:
+    """Return a mapping from each location reachable from source in the given graph to its distance from source."""
+    distances = {source: 0}
+    queue = deque([source])
+    while queue:
+        loc_id = queue.popleft()
+        for target in adjacency[loc_id]:
+            if target not in distances:
+                distances[target] = distances[loc_id] + 1
+                queue.append(target)
+    return distances
+
+
+def _strongly_connected_components(adjacency: dict[int, list[int]], nodes: Iterable[int]) \
+        -> tuple[list[list[int]], dict[int, int]]:
+    """Return the strongly connected components of the part of the given graph reachable from the given nodes,
+    and a mapping from each node in them to the index of its component, using an iterative version of Tarjan's
+    algorithm.
+
+    The components are in reverse topological order: if there is a path from a node in one component to a node in
+    another, the second component comes first.
+    """
+    index = {}
+    low = {}
+    on_stack = set()
+    stack = []
+    component_of = {}
+    components = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adjacency[root]))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(adjacency[child])))
+                    break
+                elif child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    member = None
+                    while member != node:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component_of[member] = len(components)
+                        component.append(member)
+                    components.append(component)
+
+    return components, component_of
+
+
+def _list_ids(loc_ids: list[int]) -> str:
+    """Return a short listing of the given location IDs, giving at most MAX_LISTED_IDS of them."""
+    listed = ', '.join(str(loc_id) for loc_id in sorted(loc_ids)[:MAX_LISTED_IDS])
+    if len(loc_ids) > MAX_LISTED_IDS:
+        listed += f", ... ({len(loc_ids) - MAX_LISTED_IDS} more)"
+    return listed
+
+
+if __name__ == "__main__":
+    # When you are ready to check your work with python_ta, uncomment the following lines.
+    # (Delete the "#" and space before each line.)
+    # IMPORTANT: keep this code indented inside the "if __name__ == '__main__'" block
+    import python_ta
+    python_ta.check_all(config={
+        'max-line-length': 120,
+        'disable': ['R1705', 'E9998', 'E9999', 'static_type_checker']
+    })